@@ -2,9 +2,70 @@
 Suno API Client for sunoapi.org
 """
 
+import json
+import os
+import random
+import threading
 import time
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InvalidHeader
+from urllib3.util.retry import Retry
+
+from .webhook import CallbackServer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+# Audio URL fields in order of preference, as the API response format may vary
+AUDIO_URL_FIELDS = (
+    'audioUrl',
+    'sourceAudioUrl',
+    'audio_url',
+    'streamAudioUrl',
+    'sourceStreamAudioUrl',
+)
+
+
+def _audio_url(item: Dict) -> str:
+    """Return the preferred audio URL of a sunoData item, or '' if none"""
+    for field in AUDIO_URL_FIELDS:
+        url = item.get(field)
+        if url:
+            return url
+    return ''
+
+
+def extract_audio_urls(suno_data: List[Dict]) -> List[str]:
+    """
+    Extract audio URLs from all generated variants
+
+    Args:
+        suno_data: The response.sunoData list of a status response
+
+    Returns:
+        List of audio URLs (variants without a URL are skipped)
+    """
+    return [url for url in map(_audio_url, suno_data) if url]
 
 
 class SunoAPIError(Exception):
@@ -12,27 +73,128 @@ class SunoAPIError(Exception):
     pass
 
 
+class _RangeNotSatisfied(Exception):
+    """Server answered a range request with the full body"""
+
+
 class SunoClient:
     """Client for interacting with Suno AI via sunoapi.org"""
 
     BASE_URL = "https://api.sunoapi.org/api/v1"
     COVER_ENDPOINT = "https://api.sunoapi.org/api/v1/generate/cover"
-
-    def __init__(self, api_key: str, callback_url: Optional[str] = None):
+    DOWNLOAD_RESUMES = 3  # Range-resume attempts after a dropped connection
+    RATE_LIMIT_RETRIES = 5  # Resends of a task-creating POST answered with 429
+    MAX_RETRY_AFTER = 60  # Longest Retry-After in seconds that is honoured
+    RANGE_PARTS = 4  # Concurrent byte ranges per large download
+    RANGE_MIN_SIZE = 4 << 20  # Smaller files are streamed in one request
+    DOWNLOAD_CHUNK_SIZE = 1 << 20  # Bytes per network read and file write
+    # States from which a cover can be requested while audio is still rendering
+    COVER_READY_STATES = ('TEXT_SUCCESS', 'FIRST_SUCCESS', 'SUCCESS')
+
+    def __init__(
+        self,
+        api_key: str,
+        callback_url: Optional[str] = None,
+        backoff_rate: float = 1.5,
+        max_interval: float = 30,
+        callback_server: Optional[CallbackServer] = None,
+        download_session: Optional[requests.Session] = None,
+    ):
         """
         Initialize Suno API client
 
         Args:
             api_key: Your sunoapi.org API key
             callback_url: Optional callback URL for async notifications
+            backoff_rate: Growth factor of the polling interval between status checks
+            max_interval: Upper bound in seconds for the polling interval
+            callback_server: Optional running CallbackServer that receives
+                callback_url notifications and wakes up waiting polls early
+            download_session: Optional session for media downloads, e.g. one
+                shared with other fetches; must not carry API credentials
         """
         self.api_key = api_key
         self.callback_url = callback_url or "https://example.com/callback"
+        self.backoff_rate = backoff_rate
+        self.max_interval = max_interval
+        self.callback_server = callback_server
+
+        # Terminal task states; anything else is still in progress.
+        # Subclasses may add e.g. FIRST_SUCCESS to return the first variant early.
+        # Both SUCCESS and TEXT_SUCCESS are accepted as valid completion states.
+        self._state_handlers = {
+            'SUCCESS': self._on_success,
+            'TEXT_SUCCESS': self._on_success,
+            'FAILED': self._on_failed,
+            'CREATE_TASK_FAILED': self._on_failed,
+            'GENERATE_AUDIO_FAILED': self._on_failed,
+            'CALLBACK_EXCEPTION': self._on_failed,
+            'SENSITIVE_WORD_ERROR': self._on_failed,
+        }
+
+        # Endpoint URLs, assembled once instead of on every poll
+        self._generate_url = f"{self.BASE_URL}/generate"
+        self._status_url = f"{self.BASE_URL}/generate/record-info"
+        self._cover_url = self.COVER_ENDPOINT
+
+        # Fields shared by every task-creating request, pre-encoded without
+        # the closing brace so request bodies only serialize their own fields
+        self._common_body = _json_dumps({"callBackUrl": self.callback_url})[:-1]
+
         self.session = requests.Session()
         self.session.headers.update({
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key}"
         })
+        # Pool keep-alive connections to the API host so repeated status
+        # and cover polls reuse an established TLS connection, and retry
+        # transient gateway errors inside the session instead of aborting
+        # a long wait. Only idempotent methods are retried, so a failed
+        # generate POST is never submitted (and billed) twice; rate-limited
+        # POSTs are resent separately, see _post_task().
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True,
+        )
+        self.session.mount(
+            "https://",
+            # Sized for concurrent batch submits (up to 16) plus status polls
+            HTTPAdapter(max_retries=retry, pool_connections=4, pool_maxsize=32)
+        )
+
+        # Proxy/CA settings from the environment that session.get() would
+        # apply; prepared status requests are sent directly via session.send()
+        self._status_send_settings = self.session.merge_environment_settings(
+            self._status_url, {}, None, None, None
+        )
+
+        # Last (ETag, raw body, parsed body) per status URL of tasks still
+        # in progress, so unchanged polls skip the download or the JSON parse
+        self._status_cache: Dict[str, Tuple[Optional[str], bytes, Dict]] = {}
+
+        # Separate session for media downloads: CDN URLs are pre-signed and
+        # must not receive the API Authorization header
+        if download_session is None:
+            download_session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+            download_session.mount("http://", adapter)
+            download_session.mount("https://", adapter)
+        self.download_session = download_session
+
+    def warm_up(self) -> None:
+        """
+        Open a pooled connection to the API host ahead of the first request
+
+        Resolves the host and completes the TLS handshake so the first
+        generate or status call reuses a live connection. Failures are
+        ignored, the real request will report them.
+        """
+        try:
+            self.session.head(self.BASE_URL, timeout=5).close()
+        except requests.exceptions.RequestException:
+            pass
 
     def generate_song(
         self,
@@ -96,7 +258,6 @@ class SunoClient:
             "instrumental": instrumental,
             "prompt": lyrics,
             "model": model,
-            "callBackUrl": self.callback_url,
             "vocalGender": vocal_gender
         }
 
@@ -116,13 +277,9 @@ class SunoClient:
             payload["duration"] = duration
 
         try:
-            response = self.session.post(
-                f"{self.BASE_URL}/generate",
-                json=payload,
-                timeout=30
-            )
+            response = self._post_task(self._generate_url, payload)
             response.raise_for_status()
-            result = response.json()
+            result = _json_loads(response.content)
 
             # Handle nested response structure
             task_id = result.get('taskId') or result.get('data', {}).get('taskId')
@@ -132,9 +289,51 @@ class SunoClient:
 
             return task_id
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             raise SunoAPIError(f"Failed to generate song: {e}")
 
+    def _post_task(self, url: str, payload: Dict[str, Any]) -> requests.Response:
+        """
+        POST a task-creating request, resending it while rate limited
+
+        A 429 response means the request was rejected without creating a
+        task, so unlike other failures it is safe to resend. Waits for the
+        server's Retry-After (capped at MAX_RETRY_AFTER) or backs off
+        exponentially if there is none.
+
+        Args:
+            url: Endpoint URL
+            payload: Request-specific fields, see _encode_payload()
+
+        Returns:
+            The first response that is not a 429, or the last 429 once
+            RATE_LIMIT_RETRIES resends are used up
+        """
+        data = self._encode_payload(payload)
+        attempt = 0
+        while True:
+            response = self.session.post(url, data=data, timeout=30)
+            if response.status_code != 429 or attempt >= self.RATE_LIMIT_RETRIES:
+                return response
+            response.close()
+            time.sleep(self._retry_after(response.headers.get('Retry-After'), attempt))
+            attempt += 1
+
+    def _retry_after(self, header: Optional[str], attempt: int) -> float:
+        """Seconds to wait before resending a rate-limited request"""
+        if header:
+            try:
+                return min(Retry().parse_retry_after(header), self.MAX_RETRY_AFTER)
+            except InvalidHeader:
+                pass
+        return min(0.5 * (2 ** attempt), self.MAX_RETRY_AFTER)
+
+    def _encode_payload(self, fields: Dict[str, Any]) -> bytes:
+        """Encode a request body: the shared base fields plus request-specific ones"""
+        if not fields:
+            return self._common_body + b'}'
+        return self._common_body + b',' + _json_dumps(fields)[1:]
+
     def get_status(self, task_id: str) -> Dict:
         """
         Get generation status for a task
@@ -148,31 +347,75 @@ class SunoClient:
         Raises:
             SunoAPIError: If status check fails
         """
+        return self._send_status(self._prepare_status(task_id))
+
+    def _prepare_status(self, task_id: str) -> requests.PreparedRequest:
+        """Build the status request for a task once, so polls can resend it as-is"""
+        request = requests.Request('GET', self._status_url, params={"taskId": task_id})
+        return self.session.prepare_request(request)
+
+    def _send_status(self, prepared: requests.PreparedRequest) -> Dict:
+        """
+        Send a prepared status request and parse the response
+
+        Polls are conditional: the last ETag is sent as If-None-Match and a
+        304 reuses the cached body. Without ETag support, a body identical to
+        the previous one still skips JSON parsing.
+        """
+        cached = self._status_cache.get(prepared.url)
+        if cached and cached[0]:
+            prepared.headers['If-None-Match'] = cached[0]
+
         try:
-            response = self.session.get(
-                f"{self.BASE_URL}/generate/record-info",
-                params={"taskId": task_id},
-                timeout=30
-            )
+            response = self.session.send(prepared, timeout=30, **self._status_send_settings)
+            if response.status_code == 304 and cached:
+                return cached[2]
             response.raise_for_status()
-            return response.json()
 
-        except requests.exceptions.RequestException as e:
+            body = response.content
+            if cached and cached[1] == body:
+                status = cached[2]
+            else:
+                status = _json_loads(body)
+
+        except (requests.exceptions.RequestException, ValueError) as e:
             raise SunoAPIError(f"Failed to get status: {e}")
 
+        if status.get('data', {}).get('status') in self._state_handlers:
+            # Finished tasks are not polled again
+            self._status_cache.pop(prepared.url, None)
+        else:
+            self._status_cache[prepared.url] = (response.headers.get('ETag'), body, status)
+        return status
+
     def wait_for_completion(
         self,
         task_id: str,
         poll_interval: int = 10,
-        max_wait: int = 600
+        max_wait: int = 600,
+        auto_cover: bool = False,
+        poll_schedule: Optional[Sequence[float]] = None
     ) -> Tuple[List[str], Dict]:
         """
         Wait for song generation to complete
 
+        The polling interval starts at poll_interval and grows by backoff_rate
+        up to max_interval, with +/-20% jitter. It restarts from poll_interval
+        whenever the task changes state. A poll_schedule replaces this backoff
+        with fixed delays. With a callback_server, a callback for the task
+        ends the wait early and triggers an immediate status check.
+
         Args:
             task_id: Task ID to monitor
-            poll_interval: Seconds between status checks
+            poll_interval: Initial seconds between status checks
             max_wait: Maximum seconds to wait
+            auto_cover: Start cover generation (costs credits) as soon as the
+                lyrics or first variant are ready, so it runs alongside the
+                rest of the rendering. The cover task ID is stored in the
+                returned metadata as 'coverTaskId' if the request succeeded.
+            poll_schedule: Optional seconds to sleep before each status check
+                after the first (e.g. [1, 2, 5, 10]); the last value repeats
+                and the schedule restarts whenever the task changes state
 
         Returns:
             Tuple of (audio_urls, metadata)
@@ -180,56 +423,281 @@ class SunoClient:
         Raises:
             SunoAPIError: If generation fails or times out
         """
-        start_time = time.time()
+        # Monotonic clock so wall-clock jumps neither extend nor cut the wait
+        deadline = time.monotonic() + max_wait
+        attempt = 0
+        last_state = None
+        prepared = self._prepare_status(task_id)
+        cover_requested = False
+        cover_task_id = None
+
+        if self.callback_server:
+            self.callback_server.watch((task_id,))
+        try:
+            while True:
+                status = self._send_status(prepared)
+                state = status.get('data', {}).get('status')
+
+                if auto_cover and not cover_requested and state in self.COVER_READY_STATES:
+                    cover_requested = True
+                    try:
+                        cover_task_id = self.generate_cover(task_id)
+                    except SunoAPIError:
+                        # Leave it to the caller to retry after completion
+                        pass
+
+                result = self._completion_from_status(status)
+                if result is not None:
+                    if cover_task_id:
+                        result[1]['coverTaskId'] = cover_task_id
+                    return result
+
+                # Task progressed (e.g. PENDING -> FIRST_SUCCESS), poll closely again
+                if state != last_state:
+                    attempt = 0
+                    last_state = state
+
+                # Still pending, back off and retry, but never sleep past the deadline
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise SunoAPIError(f"Timeout after {max_wait}s waiting for task {task_id}")
+                delay = self._poll_delay(poll_interval, attempt, poll_schedule)
+                self._sleep((task_id,), min(delay, remaining))
+                attempt += 1
+        finally:
+            if self.callback_server:
+                self.callback_server.forget((task_id,))
+
+    def _poll_delay(
+        self,
+        poll_interval: float,
+        attempt: int,
+        poll_schedule: Optional[Sequence[float]] = None
+    ) -> float:
+        """Delay before the next poll: the schedule, or capped exponential backoff +/-20% jitter"""
+        if poll_schedule:
+            return poll_schedule[min(attempt, len(poll_schedule) - 1)]
+        ceiling = max(poll_interval, self.max_interval)
+        interval = min(poll_interval * (self.backoff_rate ** attempt), ceiling)
+        return interval * (0.8 + 0.4 * random.random())
+
+    def _sleep(self, task_ids: Iterable[str], seconds: float) -> None:
+        """Sleep between polls, returning early if a callback for any of task_ids arrives"""
+        if self.callback_server:
+            self.callback_server.wait_any(task_ids, seconds)
+        else:
+            time.sleep(seconds)
 
-        while True:
-            elapsed = time.time() - start_time
-            if elapsed > max_wait:
-                raise SunoAPIError(f"Timeout after {max_wait}s waiting for task {task_id}")
+    def generate_songs(
+        self,
+        specs: List[Dict[str, Any]],
+        max_workers: int = 8
+    ) -> List[Union[str, SunoAPIError]]:
+        """
+        Start several generations concurrently
+
+        Args:
+            specs: List of keyword argument dicts for generate_song()
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            List aligned with specs holding the task ID, or the SunoAPIError
+            if that song could not be started
+        """
+        if not specs:
+            return []
+
+        def start(spec: Dict[str, Any]) -> Union[str, SunoAPIError]:
+            try:
+                return self.generate_song(**spec)
+            except SunoAPIError as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(specs))) as executor:
+            return list(executor.map(start, specs))
 
+    def wait_for_all(
+        self,
+        task_ids: List[str],
+        poll_interval: int = 10,
+        max_wait: int = 600,
+        max_workers: int = 8
+    ) -> Dict[str, Union[Tuple[List[str], Dict], SunoAPIError]]:
+        """
+        Wait for several tasks, polling all pending tasks once per round
+
+        Args:
+            task_ids: Task IDs to monitor
+            poll_interval: Initial seconds between polling rounds
+            max_wait: Maximum seconds to wait for all tasks
+            max_workers: Maximum number of concurrent status requests
+
+        Returns:
+            Dict mapping each task ID to (audio_urls, metadata), or to the
+            SunoAPIError if it failed or timed out
+        """
+        return dict(self.iter_completed(task_ids, poll_interval, max_wait, max_workers))
+
+    def iter_completed(
+        self,
+        task_ids: List[str],
+        poll_interval: int = 10,
+        max_wait: int = 600,
+        max_workers: int = 8,
+        auto_cover: Iterable[str] = (),
+        poll_schedule: Optional[Sequence[float]] = None
+    ) -> Iterator[Tuple[str, Union[Tuple[List[str], Dict], SunoAPIError]]]:
+        """
+        Poll several tasks together and yield each one as soon as it finishes
+
+        All pending tasks are checked concurrently once per round, so callers
+        can start processing a finished task while others are still rendering.
+        With a callback_server, a callback for any pending task starts the
+        next round early.
+
+        Args:
+            task_ids: Task IDs to monitor
+            poll_interval: Initial seconds between polling rounds
+            max_wait: Maximum seconds to wait for all tasks
+            max_workers: Maximum number of concurrent status requests
+            auto_cover: Task IDs to start cover generation for (costs credits)
+                as soon as their lyrics or first variant are ready, see
+                wait_for_completion()
+            poll_schedule: Optional seconds to sleep before each polling
+                round after the first; the last value repeats
+
+        Yields:
+            (task_id, (audio_urls, metadata)) for finished tasks, or
+            (task_id, SunoAPIError) if a task failed or timed out
+        """
+        deadline = time.monotonic() + max_wait
+        pending = set(task_ids)
+        cover_wanted = set(auto_cover) & pending
+        cover_task_ids: Dict[str, str] = {}
+        attempt = 0
+
+        if not pending:
+            return
+
+        if self.callback_server:
+            self.callback_server.watch(pending)
+
+        def poll(task_id: str) -> Optional[Tuple[List[str], Dict]]:
             status = self.get_status(task_id)
-            data = status.get('data', {})
-            state = data.get('status', 'PENDING')
-
-            # Accept both SUCCESS and TEXT_SUCCESS as valid completion states
-            if state in ('SUCCESS', 'TEXT_SUCCESS'):
-                # Extract audio URLs from nested structure
-                response_data = data.get('response', {})
-                suno_data = response_data.get('sunoData', [])
-
-                if not suno_data:
-                    raise SunoAPIError(f"No sunoData in successful response: {status}")
-
-                # Extract URLs from all generated variants
-                # Try multiple URL fields as API response format may vary
-                audio_urls = []
-                for item in suno_data:
-                    # Try in order of preference: audioUrl > sourceAudioUrl > streamAudioUrl > sourceStreamAudioUrl
-                    url = (item.get('audioUrl') or
-                           item.get('sourceAudioUrl') or
-                           item.get('audio_url') or
-                           item.get('streamAudioUrl') or
-                           item.get('sourceStreamAudioUrl') or
-                           '')
-                    if url:
-                        audio_urls.append(url)
-
-                if not audio_urls:
-                    raise SunoAPIError(f"No valid audio URLs found in response. sunoData: {suno_data}")
-
-                return audio_urls, data
-
-            elif state == 'FAILED':
-                error_msg = data.get('error', 'Unknown error')
-                raise SunoAPIError(f"Generation failed: {error_msg}")
-
-            # Still pending, wait and retry
-            time.sleep(poll_interval)
+            state = status.get('data', {}).get('status')
+
+            if task_id in cover_wanted and state in self.COVER_READY_STATES:
+                cover_wanted.discard(task_id)
+                try:
+                    cover_task_ids[task_id] = self.generate_cover(task_id)
+                except SunoAPIError:
+                    # Leave it to the caller to retry after completion
+                    pass
+
+            result = self._completion_from_status(status)
+            if result is not None and task_id in cover_task_ids:
+                result[1]['coverTaskId'] = cover_task_ids[task_id]
+            return result
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            try:
+                while True:
+                    futures = {executor.submit(poll, tid): tid for tid in pending}
+                    for future in as_completed(futures):
+                        task_id = futures[future]
+                        try:
+                            result = future.result()
+                        except SunoAPIError as e:
+                            result = e
+                        if result is not None:
+                            pending.discard(task_id)
+                            yield task_id, result
+
+                    if not pending:
+                        return
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        for task_id in sorted(pending):
+                            yield task_id, SunoAPIError(
+                                f"Timeout after {max_wait}s waiting for task {task_id}"
+                            )
+                        return
+
+                    delay = self._poll_delay(poll_interval, attempt, poll_schedule)
+                    self._sleep(pending, min(delay, remaining))
+                    attempt += 1
+            finally:
+                if self.callback_server:
+                    self.callback_server.forget(task_ids)
+
+    def check_completion(self, task_id: str) -> Optional[Tuple[List[str], Dict]]:
+        """
+        Check a task once without waiting
+
+        Lets a single thread multiplex many pending tasks instead of
+        blocking one thread per task in wait_for_completion().
+
+        Args:
+            task_id: Task ID to check
+
+        Returns:
+            Tuple of (audio_urls, metadata) if complete, None if still pending
+
+        Raises:
+            SunoAPIError: If generation failed or the status check fails
+        """
+        return self._completion_from_status(self.get_status(task_id))
+
+    def _completion_from_status(self, status: Dict) -> Optional[Tuple[List[str], Dict]]:
+        """Extract (audio_urls, metadata) from a status response, None if pending"""
+        data = status.get('data', {})
+        state = data.get('status', 'PENDING')
+
+        handler = self._state_handlers.get(state)
+        if handler is None:
+            # PENDING, FIRST_SUCCESS and any other in-progress state
+            return None
+        return handler(status)
+
+    def _on_success(self, status: Dict) -> Tuple[List[str], Dict]:
+        """Handle a completed task: return its audio URLs and metadata"""
+        data = status.get('data', {})
+
+        # Extract audio URLs from nested structure
+        response_data = data.get('response', {})
+        suno_data = response_data.get('sunoData', ())
+
+        if not suno_data:
+            raise SunoAPIError(f"No sunoData in successful response: {status}")
+
+        # Extract URLs from all generated variants
+        audio_urls = extract_audio_urls(suno_data)
+
+        if not audio_urls:
+            raise SunoAPIError(f"No valid audio URLs found in response. sunoData: {suno_data}")
+
+        return audio_urls, data
+
+    def _on_failed(self, status: Dict) -> None:
+        """Handle a failed task by raising its error"""
+        data = status.get('data', {})
+        state = data.get('status')
+        error_msg = data.get('error') or data.get('errorMessage') or 'Unknown error'
+        if state != 'FAILED':
+            error_msg = f"{error_msg} ({state})"
+        raise SunoAPIError(f"Generation failed: {error_msg}")
 
     def download_audio(self, url: str, output_path: str) -> None:
         """
         Download audio file from URL
 
+        Large files on servers that support byte ranges are fetched as
+        RANGE_PARTS concurrent ranges written in place; the size is taken from
+        the first response, which also serves the first range. Otherwise the
+        file is streamed. Either way a connection dropped mid-transfer is
+        resumed from the last written byte with an HTTP Range request.
+
         Args:
             url: Audio file URL
             output_path: Local path to save file
@@ -238,16 +706,206 @@ class SunoClient:
             SunoAPIError: If download fails
         """
         try:
-            response = requests.get(url, timeout=60, stream=True)
+            response = self.download_session.get(url, timeout=60, stream=True)
             response.raise_for_status()
 
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            size = self._range_download_size(response)
+            if size:
+                try:
+                    self._download_ranges(url, output_path, size, response)
+                    return
+                except _RangeNotSatisfied:
+                    # Server advertised ranges but did not honour them
+                    response = None
+
+            self._download_stream(url, output_path, response)
 
         except requests.exceptions.RequestException as e:
             raise SunoAPIError(f"Failed to download audio: {e}")
 
+    def _range_download_size(self, response: requests.Response) -> Optional[int]:
+        """Return the file size if the file should be fetched in parallel ranges"""
+        if self.RANGE_PARTS < 2 or not hasattr(os, 'pwrite'):
+            return None
+        if response.headers.get('Accept-Ranges', '').lower() != 'bytes':
+            return None
+
+        try:
+            size = int(response.headers.get('Content-Length', 0))
+        except ValueError:
+            return None
+        return size if size >= self.RANGE_MIN_SIZE else None
+
+    def _download_ranges(
+        self,
+        url: str,
+        output_path: str,
+        size: int,
+        first: requests.Response
+    ) -> None:
+        """
+        Fetch disjoint byte ranges concurrently and pwrite them in place
+
+        The full-body response `first` serves the first range. A range whose
+        connection drops is re-requested from its last written byte. Once a
+        range fails for good the others stop, as the caller falls back to a
+        full download or gives up anyway.
+        """
+        part_size = -(-size // self.RANGE_PARTS)
+        ranges = [(lo, min(lo + part_size, size) - 1) for lo in range(0, size, part_size)]
+        cancelled = threading.Event()
+
+        def fetch(lo: int, hi: int, response: Optional[requests.Response] = None) -> None:
+            offset = lo
+            resumes = 0
+            while True:
+                if cancelled.is_set():
+                    if response is not None:
+                        response.close()
+                    return
+                if response is None:
+                    response = self.download_session.get(
+                        url, timeout=60, stream=True, headers={'Range': f'bytes={offset}-{hi}'}
+                    )
+                    response.raise_for_status()
+                    if response.status_code != 206:
+                        response.close()
+                        raise _RangeNotSatisfied()
+
+                try:
+                    with response:
+                        for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                            # The full-body response runs past its range, stop there
+                            view = memoryview(chunk)[:hi + 1 - offset]
+                            while view:
+                                written = os.pwrite(fd, view, offset)
+                                offset += written
+                                view = view[written:]
+                            if offset > hi or cancelled.is_set():
+                                break
+                except (requests.exceptions.ConnectionError,
+                        requests.exceptions.ChunkedEncodingError):
+                    if resumes >= self.DOWNLOAD_RESUMES:
+                        raise
+
+                if offset > hi or cancelled.is_set():
+                    return
+
+                # Dropped or short response, resume the rest of this range
+                resumes += 1
+                if resumes > self.DOWNLOAD_RESUMES:
+                    raise requests.exceptions.ChunkedEncodingError(
+                        f"Incomplete range {lo}-{hi}: got {offset - lo} bytes"
+                    )
+                response = None
+
+        fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            self._preallocate(fd, size)
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                futures = [executor.submit(fetch, *ranges[0], first)]
+                futures += [executor.submit(fetch, lo, hi) for lo, hi in ranges[1:]]
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except BaseException:
+                    # Let the other ranges stop at their next chunk
+                    cancelled.set()
+                    raise
+            os.ftruncate(fd, size)
+        finally:
+            first.close()
+            os.close(fd)
+
+    def _download_stream(
+        self,
+        url: str,
+        output_path: str,
+        response: Optional[requests.Response] = None
+    ) -> None:
+        """
+        Stream a file to disk, resuming with Range requests on dropped connections
+
+        Args:
+            url: File URL
+            output_path: Local path to save file
+            response: Optional already opened full-body response to start with
+        """
+        written = 0
+        resumes = 0
+
+        # Buffer matches the chunk size: one write(2) per network chunk
+        with open(output_path, 'wb', buffering=self.DOWNLOAD_CHUNK_SIZE) as f:
+            while True:
+                if response is None:
+                    headers = {'Range': f'bytes={written}-'} if written else None
+                    response = self.download_session.get(
+                        url, timeout=60, stream=True, headers=headers
+                    )
+                    response.raise_for_status()
+
+                if written and response.status_code != 206:
+                    # Server ignored the range, start over
+                    f.seek(0)
+                    f.truncate()
+                    written = 0
+
+                if not written:
+                    try:
+                        self._preallocate(f.fileno(), int(response.headers['Content-Length']))
+                    except (KeyError, ValueError):
+                        pass
+
+                try:
+                    with response:
+                        for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                            written += len(chunk)
+                    break
+                except (requests.exceptions.ConnectionError,
+                        requests.exceptions.ChunkedEncodingError):
+                    resumes += 1
+                    if resumes > self.DOWNLOAD_RESUMES:
+                        raise
+                    response = None
+
+            # Drop any preallocated space beyond the received data
+            f.truncate(written)
+
+    @staticmethod
+    def _preallocate(fd: int, size: int) -> None:
+        """Reserve disk space for the whole file up front where supported"""
+        if not hasattr(os, 'posix_fallocate') or size <= 0:
+            return
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except OSError:
+            # Not supported by the filesystem
+            pass
+
+    def download_all(self, pairs: List[Tuple[str, str]], max_workers: int = 4) -> None:
+        """
+        Download several files concurrently
+
+        Downloads are network-bound, so variants are fetched in parallel over
+        the shared keep-alive download session.
+
+        Args:
+            pairs: List of (url, output_path) tuples
+            max_workers: Maximum number of concurrent downloads
+
+        Raises:
+            SunoAPIError: If any download fails
+        """
+        if not pairs:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as executor:
+            futures = [executor.submit(self.download_audio, url, path) for url, path in pairs]
+            for future in as_completed(futures):
+                # Re-raise the first failure as soon as it happens
+                future.result()
+
     def generate_cover(self, music_task_id: str) -> str:
         """
         Generate cover art for a music task
@@ -263,19 +921,12 @@ class SunoClient:
         Raises:
             SunoAPIError: If cover generation request fails
         """
-        payload = {
-            "taskId": music_task_id,
-            "callBackUrl": self.callback_url
-        }
+        payload = {"taskId": music_task_id}
 
         try:
-            response = self.session.post(
-                self.COVER_ENDPOINT,
-                json=payload,
-                timeout=30
-            )
+            response = self._post_task(self._cover_url, payload)
             response.raise_for_status()
-            result = response.json()
+            result = _json_loads(response.content)
 
             # Handle nested response structure
             task_id = result.get('taskId') or result.get('data', {}).get('taskId')
@@ -285,7 +936,7 @@ class SunoClient:
 
             return task_id
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             raise SunoAPIError(f"Failed to generate cover: {e}")
 
     def get_cover_urls(self, cover_task_id: str) -> Tuple[List[str], Dict]:
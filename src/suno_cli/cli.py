@@ -2,23 +2,87 @@
 CLI interface for suno-cli
 """
 
+import errno
 import os
+import re
 import sys
 import json
+import threading
+import time
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import click
 import requests
+from requests.adapters import HTTPAdapter
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from urllib3.util.retry import Retry
 
-from .api import SunoClient, SunoAPIError
-from .tags import set_id3_tags, extract_tags_from_metadata, TaggingError
-from .config import Config, ConfigError
+from .api import SunoClient, SunoAPIError, extract_audio_urls
+from .tags import tag_many, extract_tags_from_metadata, load_cover
+from .config import Config, ConfigError, load_yaml
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 console = Console()
 
+# Keep-alive session for unauthenticated fetches (content URLs and media
+# downloads), so repeated requests to a host skip the TCP/TLS handshake
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    # Parallel batches download several songs x variants x byte ranges
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+# Characters that are invalid in filenames, mapped to '_' in a single pass
+_INVALID_FILENAME_TRANS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+# Placeholders supported by format_filename()
+_FILENAME_PLACEHOLDER = re.compile(r'\{(title|artist|track|variant)\}')
+
+# Upper bound for prompts, styles and batch files fetched from a URL
+MAX_CONTENT = 4 * 1024 * 1024
+
+# open() errors meaning a content source is a plain string, not a file
+_NOT_A_PATH_ERRNOS = frozenset({
+    errno.ENOENT, errno.ENOTDIR, errno.ENAMETOOLONG, errno.ELOOP, errno.EINVAL
+})
+
+
+@lru_cache(maxsize=32)
+def compile_filename_format(format_string: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """
+    Split a filename format into literal text and placeholders
+
+    Results are cached, so a format used for every variant of every song
+    is only scanned once.
+
+    Args:
+        format_string: Format string with placeholders
+
+    Returns:
+        Tuple of (literal text, placeholder name or None) pairs
+    """
+    parts = []
+    pos = 0
+    for match in _FILENAME_PLACEHOLDER.finditer(format_string):
+        parts.append((format_string[pos:match.start()], match.group(1)))
+        pos = match.end()
+    parts.append((format_string[pos:], None))
+    return tuple(parts)
+
 
 def format_filename(
     format_string: str,
@@ -51,32 +115,352 @@ def format_filename(
         if value is None:
             return "Unknown"
         # Replace invalid filename characters
-        invalid_chars = '<>:"/\\|?*'
-        result = str(value)
-        for char in invalid_chars:
-            result = result.replace(char, '_')
-        return result.strip()
+        return str(value).translate(_INVALID_FILENAME_TRANS).strip()
 
     # Format track number with leading zero if needed
     track_str = f"{track:02d}" if track is not None and track < 100 else str(track) if track is not None else ""
 
-    # Replace placeholders
-    filename = format_string
-    filename = filename.replace("{title}", sanitize(title))
-    filename = filename.replace("{artist}", sanitize(artist))
-    filename = filename.replace("{track}", track_str)
-    filename = filename.replace("{variant}", str(variant))
+    # Fill in placeholders; other braces are kept literally
+    values = {
+        'title': sanitize(title),
+        'artist': sanitize(artist),
+        'track': track_str,
+        'variant': str(variant),
+        None: '',
+    }
+    parts = compile_filename_format(format_string)
+    return ''.join(literal + values[field] for literal, field in parts)
+
+
+# Guards the claimed-path sets of unique_output_paths()
+_CLAIM_LOCK = threading.Lock()
+
+
+def unique_output_paths(paths: List[Path], claimed: Optional[Set[str]] = None) -> List[Path]:
+    """
+    Make output paths unique so concurrent downloads never share a file
+
+    A filename_format without {variant} names all variants of a song alike,
+    and songs of a batch without subdirectories can clash as well. Repeated
+    paths get " (2)", " (3)", ... appended to their stem.
+
+    Args:
+        paths: Output paths in download order
+        claimed: Absolute paths already in use, shared by the songs of a
+            batch; updated with the returned paths
+
+    Returns:
+        Paths aligned with the input, each used only once
+    """
+    if claimed is None:
+        claimed = set()
+    unique = []
+    with _CLAIM_LOCK:
+        for path in paths:
+            candidate = path
+            n = 2
+            while os.path.abspath(candidate) in claimed:
+                candidate = path.with_name(f"{path.stem} ({n}){path.suffix}")
+                n += 1
+            claimed.add(os.path.abspath(candidate))
+            unique.append(candidate)
+    return unique
+
+
+# Batch song fields that fall back to a differently named config key
+_SONG_CONFIG_KEYS = {
+    'model': 'default_model',
+    'gender': 'default_gender',
+    'artist': 'default_artist',
+    'album': 'default_album',
+}
+
+
+# Batch song fields without a config file counterpart: they come from the
+# song or the YAML defaults only, so a stray `prompt:` or `generate_cover:`
+# in config.yaml never applies to every song
+_SONG_ONLY_KEYS = ('prompt', 'style', 'cover', 'instrumental', 'duration', 'generate_cover')
+
+
+def _song_options(song_def: dict) -> dict:
+    """Key batch song fields like the config file, for Config.resolve()"""
+    return {_SONG_CONFIG_KEYS.get(key, key): value for key, value in song_def.items()}
+
+
+@dataclass
+class SongSpec:
+    """Resolved and validated settings of one batch song"""
+
+    index: int
+    title: str
+    prompt: str  # File path, URL, or direct string
+    style: str  # File path, URL, or direct string
+    output_path: Path
+    model: str
+    gender: str
+    artist: str
+    album: Optional[str]
+    track: int
+    instrumental: bool = False
+    duration: Optional[int] = None
+    cover: Optional[str] = None
+    generate_cover: bool = False
+
+    def __post_init__(self):
+        # YAML may give numbers as strings (e.g. track: "03")
+        self.track = int(self.track)
+        if self.duration is not None:
+            self.duration = int(self.duration)
+        self.instrumental = bool(self.instrumental)
+        self.generate_cover = bool(self.generate_cover)
+
+    def load_request(self, content_cache: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        Load prompt and style content and build generate_song() arguments
+
+        Args:
+            content_cache: Optional dict shared by the songs of a batch, so a
+                prompt or style file or URL used by several songs is read once
+
+        Returns:
+            Keyword arguments for SunoClient.generate_song()
+        """
+        def load(source: str, content_type: str) -> str:
+            if content_cache is None:
+                return load_content(source, content_type, quiet=True)
+            if source not in content_cache:
+                content_cache[source] = load_content(source, content_type, quiet=True)
+            return content_cache[source]
+
+        return {
+            'lyrics': load(self.prompt, f"prompt for song {self.index}"),
+            'title': self.title,
+            'style': load(self.style, f"style for song {self.index}"),
+            'model': self.model,
+            'vocal_gender': self.gender,
+            'instrumental': self.instrumental,
+            'duration': self.duration,
+            'custom_mode': True,
+        }
+
+    def download_options(self) -> Dict[str, Any]:
+        """
+        Build the song-specific process_song_download() arguments
+
+        Returns:
+            Keyword arguments for process_song_download()
+        """
+        return {
+            'title': self.title,
+            'output_path': self.output_path,
+            'cover': self.cover,
+            'generate_cover': self.generate_cover,
+            'artist': self.artist,
+            'album': self.album,
+            'track': self.track,
+        }
+
+
+def build_song_specs(
+    songs: List[Dict[str, Any]],
+    config: Config,
+    batch_defaults: Dict[str, Any],
+    base_path: Path,
+    use_subdirectories: bool
+) -> List[SongSpec]:
+    """
+    Resolve and validate all batch songs before anything is generated
+
+    Args:
+        songs: Song definitions from the batch YAML
+        config: Loaded config
+        batch_defaults: YAML 'defaults' section, keyed like the config file
+        base_path: Output base directory
+        use_subdirectories: Whether each song gets its own subdirectory
+
+    Returns:
+        List of SongSpec in batch order
+
+    Raises:
+        ConfigError: If any song definition is invalid, listing all
+            problems one per line
+    """
+    # Batch-wide layers are resolved once, each song only adds its own fields
+    # Priority: song > yaml defaults > config file > DEFAULTS
+    batch_options = config.resolve(
+        {key: value for key, value in batch_defaults.items() if key not in _SONG_ONLY_KEYS}
+    )
+    # Priority for _SONG_ONLY_KEYS: song > yaml defaults
+    song_only_defaults = {
+        key: value for key, value in batch_defaults.items()
+        if key in _SONG_ONLY_KEYS and value is not None
+    }
+
+    specs = []
+    errors = []
+    for idx, song_def in enumerate(songs, 1):
+        if not isinstance(song_def, dict):
+            errors.append(f"Song {idx} must be a mapping of fields")
+            continue
+
+        song_layer = {
+            key: value for key, value in _song_options(song_def).items() if value is not None
+        }
+        options = batch_options.new_child(
+            {key: value for key, value in song_layer.items() if key not in _SONG_ONLY_KEYS}
+        )
+        fields = ChainMap(song_layer, song_only_defaults)
+
+        # Validate required fields, collecting every problem in the batch
+        song_errors = []
+        if not song_def.get('title'):
+            song_errors.append(f"Song {idx} missing required field 'title'")
+        if not fields.get('prompt'):
+            song_errors.append(f"Song {idx} missing 'prompt' field")
+        if not fields.get('style'):
+            song_errors.append(f"Song {idx} missing 'style' field")
+        if song_errors:
+            errors.extend(song_errors)
+            continue
+
+        # Determine output directory
+        output_dir = song_def.get('output')
+        if output_dir:
+            output_path = Path(output_dir)
+            if not output_path.is_absolute():
+                output_path = base_path / output_dir
+        elif use_subdirectories:
+            output_path = base_path / f"song_{idx:02d}"
+        else:
+            output_path = base_path
+
+        try:
+            specs.append(SongSpec(
+                index=idx,
+                title=song_def['title'],
+                prompt=fields['prompt'],
+                style=fields['style'],
+                output_path=output_path,
+                model=options['default_model'],
+                gender=options['default_gender'],
+                artist=options['default_artist'],
+                album=options['default_album'],
+                track=song_def.get('track') or idx,
+                instrumental=fields.get('instrumental', False),
+                duration=fields.get('duration'),
+                cover=fields.get('cover'),
+                generate_cover=fields.get('generate_cover', False),
+            ))
+        except (TypeError, ValueError) as e:
+            errors.append(f"Song {idx} has an invalid 'track' or 'duration': {e}")
+
+    if errors:
+        raise ConfigError("\n".join(errors))
+    return specs
+
+
+def _poll_schedule(config: Config) -> Optional[Tuple[float, ...]]:
+    """Read the optional poll_schedule config list, exiting unless it holds positive seconds"""
+    schedule = config.get('poll_schedule')
+    if not schedule:
+        return None
+    # bool is an int subclass, but `[true, 5]` is certainly a typo
+    if not isinstance(schedule, (list, tuple)) or not all(
+        isinstance(seconds, (int, float)) and not isinstance(seconds, bool) and seconds > 0
+        for seconds in schedule
+    ):
+        console.print(
+            "[red]Error: poll_schedule must be a list of positive seconds, "
+            "e.g. [5, 10, 20, 30][/red]"
+        )
+        sys.exit(1)
+    return tuple(float(seconds) for seconds in schedule)
+
+
+def _cover_download_count(mode: str, available: int) -> int:
+    """Number of generated cover variants to download for a --covers-download mode"""
+    return {'all': available, 'first': min(available, 1), 'none': 0}[mode]
+
+
+def _progress():
+    """
+    Create the spinner progress display, importing rich.progress on first use
+
+    Redraws are capped at a few per second, and the display is disabled when
+    output is not a terminal (e.g. piped to a log file).
+    """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
 
-    return filename
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        refresh_per_second=4,
+        disable=not console.is_terminal
+    )
 
 
-def load_content(source: str, content_type: str = "content") -> str:
+def write_metadata(path: Path, data: dict) -> None:
+    """
+    Write task metadata as indented JSON, using orjson when installed
+
+    The document is serialized in memory and written in one call.
+
+    Args:
+        path: Output file path
+        data: Metadata dictionary
+    """
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(data, indent=2), encoding='utf-8')
+
+
+def _read_text_file(path: str) -> str:
+    """
+    Read a small UTF-8 text file, normally with one sized read
+
+    Skips the buffered text layer of open(); newlines are normalized the
+    way text mode would.
+
+    Args:
+        path: File path
+
+    Returns:
+        File content
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        size = os.fstat(fd).st_size
+        # os.read() may return fewer bytes than asked for, keep reading until
+        # size bytes arrived. Pipes and special files report no size, read
+        # them to EOF.
+        chunks = []
+        remaining = size
+        while True:
+            chunk = os.read(fd, remaining or 64 * 1024)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if size:
+                remaining -= len(chunk)
+                if remaining <= 0:
+                    break
+        data = b''.join(chunks)
+    finally:
+        os.close(fd)
+    return data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def load_content(source: str, content_type: str = "content", quiet: bool = False) -> str:
     """
     Load content from a file, URL, or treat as direct string
 
     Args:
         source: File path, URL, or direct string content
         content_type: Type of content for logging (e.g., "prompt", "style")
+        quiet: Don't log direct string content (fetches and file reads are
+            still logged)
 
     Returns:
         Content as string
@@ -85,29 +469,134 @@ def load_content(source: str, content_type: str = "content") -> str:
     if source.startswith(('http://', 'https://')):
         try:
             console.print(f"[dim]Fetching {content_type} from URL: {source}[/dim]")
-            response = requests.get(source, timeout=30)
-            response.raise_for_status()
-            return response.text.strip()
+            with _SESSION.get(source, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                # Read in chunks so a runaway download fails fast
+                body = bytearray()
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    body += chunk
+                    if len(body) > MAX_CONTENT:
+                        console.print(
+                            f"[red]Error fetching {content_type} from URL: "
+                            f"content exceeds {MAX_CONTENT // (1024 * 1024)} MiB[/red]"
+                        )
+                        sys.exit(1)
+            return body.decode('utf-8', errors='replace').strip()
         except requests.exceptions.RequestException as e:
             console.print(f"[red]Error fetching {content_type} from URL: {e}[/red]")
             sys.exit(1)
 
-    # Check if it's a file
-    if Path(source).exists():
-        try:
-            with open(source, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                console.print(f"[dim]Loaded {content_type} from file: {source}[/dim]")
-                return content
-        except Exception as e:
+    # Multi-line or very long strings are never paths, skip the stat() call
+    if '\n' in source or len(source) > 4096:
+        if not quiet:
+            console.print(f"[dim]Using {content_type} string (length: {len(source)} chars)[/dim]")
+        return source
+
+    # Check if it's a file by opening it, without a separate exists() call
+    try:
+        content = _read_text_file(source).strip()
+    except UnicodeDecodeError as e:
+        console.print(f"[red]Error reading {content_type} file: {e}[/red]")
+        sys.exit(1)
+    except ValueError:
+        pass  # Embedded null byte, not a path
+    except OSError as e:
+        if e.errno not in _NOT_A_PATH_ERRNOS:
             console.print(f"[red]Error reading {content_type} file: {e}[/red]")
             sys.exit(1)
+    else:
+        console.print(f"[dim]Loaded {content_type} from file: {source}[/dim]")
+        return content
 
     # Treat as direct string
-    console.print(f"[dim]Using {content_type} string (length: {len(source)} chars)[/dim]")
+    if not quiet:
+        console.print(f"[dim]Using {content_type} string (length: {len(source)} chars)[/dim]")
     return source
 
 
+class _ContentTooLarge(Exception):
+    """Fetched content exceeded MAX_CONTENT"""
+
+
+class _CappedReader:
+    """File-like wrapper that fails once more than `limit` bytes were read"""
+
+    def __init__(self, raw: Any, limit: int):
+        self._raw = raw
+        self._remaining = limit
+
+    def read(self, size: int = -1) -> bytes:
+        # Never ask for more than one byte past the limit
+        if size is None or size < 0 or size > self._remaining + 1:
+            size = self._remaining + 1
+        data = self._raw.read(size)
+        self._remaining -= len(data)
+        if self._remaining < 0:
+            raise _ContentTooLarge()
+        return data
+
+
+def load_yaml_content(
+    source: str,
+    content_type: str = "YAML",
+    allow_string: bool = True
+) -> Any:
+    """
+    Parse YAML from a file, URL, or direct string
+
+    Files and URL responses are parsed as they are read, without first
+    buffering the whole document into a string.
+
+    Args:
+        source: File path, URL, or direct YAML content
+        content_type: Type of content for logging (e.g., "batch YAML")
+        allow_string: Treat a source that is neither URL nor file as YAML;
+            if False, exit with a file-not-found error instead
+
+    Returns:
+        Parsed YAML data
+    """
+    # Check if it's a URL
+    if source.startswith(('http://', 'https://')):
+        try:
+            console.print(f"[dim]Fetching {content_type} from URL: {source}[/dim]")
+            with _SESSION.get(source, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                try:
+                    length = int(response.headers.get('Content-Length') or 0)
+                except ValueError:
+                    # Malformed header, the capped reader still enforces the limit
+                    length = 0
+                if length > MAX_CONTENT:
+                    raise _ContentTooLarge()
+                # Let urllib3 undo gzip/deflate transfer encoding while parsing,
+                # counting the decoded bytes so a runaway response fails fast
+                response.raw.decode_content = True
+                return load_yaml(_CappedReader(response.raw, MAX_CONTENT))
+        except _ContentTooLarge:
+            console.print(
+                f"[red]Error fetching {content_type} from URL: "
+                f"content exceeds {MAX_CONTENT // (1024 * 1024)} MiB[/red]"
+            )
+            sys.exit(1)
+        except requests.exceptions.RequestException as e:
+            console.print(f"[red]Error fetching {content_type} from URL: {e}[/red]")
+            sys.exit(1)
+
+    # Check if it's a file (multi-line strings never are)
+    if '\n' not in source and Path(source).is_file():
+        console.print(f"[dim]Loaded {content_type} from file: {source}[/dim]")
+        with open(source, 'rb') as f:
+            return load_yaml(f)
+
+    if not allow_string:
+        console.print(f"[red]Error: {content_type} file not found: {source}[/red]")
+        sys.exit(1)
+
+    # Treat as direct string
+    return load_yaml(source)
+
+
 @click.group(context_settings=dict(help_option_names=['-h', '--help']))
 @click.version_option()
 @click.option('--config', type=click.Path(), help='Path to config file (default: ~/.suno-cli/config.yaml)')
@@ -144,6 +633,9 @@ def cli(ctx, config):
 @click.option('--duration', '-d', type=int, help='[Experimental] Song duration in seconds')
 @click.option('--cover', '-c', type=click.Path(exists=True), help='Custom cover image (overrides API cover)')
 @click.option('--generate-cover', is_flag=True, help='Generate cover art using Suno API (costs credits)')
+@click.option('--covers-download', type=click.Choice(['all', 'first', 'none']), default='first',
+              help='Generated cover variants to download '
+                   '(default: first, others are listed in the metadata)')
 @click.option('--artist', help='Artist name for ID3 tags (default: from config or Suno AI)')
 @click.option('--album', help='Album name for ID3 tags')
 @click.option('--track', type=int, help='Track number for ID3 tags (e.g., 5 for track 5 of album)')
@@ -166,6 +658,7 @@ def generate(
     duration: Optional[int],
     cover: Optional[str],
     generate_cover: bool,
+    covers_download: str,
     artist: str,
     album: Optional[str],
     track: Optional[int],
@@ -225,14 +718,25 @@ def generate(
         console.print("Specify with -o/--output or set default_output_dir in config file")
         sys.exit(1)
 
-    model = model or config.get('default_model', 'V4_5ALL')
-    gender = gender or config.get('default_gender', 'male')
-    artist = artist or config.get('default_artist', 'Suno AI')
-    album = album or config.get('default_album')
-    callback_url = callback_url or config.get('callback_url')
-    poll_interval = poll_interval if poll_interval is not None else config.get('poll_interval', 10)
-    max_wait = max_wait if max_wait is not None else config.get('max_wait', 600)
-    filename_format = filename_format or config.get('filename_format', '{track} - {artist} - {title} ({variant}).mp3')
+    options = config.resolve({
+        'default_model': model,
+        'default_gender': gender,
+        'default_artist': artist,
+        'default_album': album,
+        'callback_url': callback_url,
+        'poll_interval': poll_interval,
+        'max_wait': max_wait,
+        'filename_format': filename_format,
+    })
+    model = options['default_model']
+    gender = options['default_gender']
+    artist = options['default_artist']
+    album = options['default_album']
+    callback_url = options['callback_url']
+    poll_interval = options['poll_interval']
+    max_wait = options['max_wait']
+    filename_format = options['filename_format']
+    poll_schedule = _poll_schedule(config)
 
     # Get API key
     if not api_key:
@@ -266,18 +770,18 @@ def generate(
     output_path.mkdir(parents=True, exist_ok=True)
 
     # Initialize client with callback URL if provided
-    client = SunoClient(api_key, callback_url=callback_url if callback_url else None)
+    client = SunoClient(
+        api_key,
+        callback_url=callback_url if callback_url else None,
+        download_session=_SESSION
+    )
 
     try:
         # Show mode info
         mode_str = "Custom Mode" if custom_mode else "Simple Mode (AI will generate title & style)"
         console.print(f"[dim]Mode: {mode_str}[/dim]")
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
+        with _progress() as progress:
             # Start generation
             task_desc = f"Starting generation for '{title}'..." if title else "Starting generation..."
             task = progress.add_task(task_desc, total=None)
@@ -298,55 +802,24 @@ def generate(
             # Wait for completion
             progress.update(task, description=f"Generating '{title}' (this may take 2-3 minutes)...")
 
+            # Cover generation is started early, while the audio is still rendering
             audio_urls, metadata = client.wait_for_completion(
                 task_id,
                 poll_interval=poll_interval,
-                max_wait=max_wait
+                max_wait=max_wait,
+                auto_cover=generate_cover and not cover,
+                poll_schedule=poll_schedule
             )
 
             console.print(f"[green]✓[/green] Generation complete! Found {len(audio_urls)} variant(s)")
 
-            # Generate cover art if requested (costs additional credits!)
-            generated_cover_urls = []
-            if generate_cover and not cover:  # Only if no custom cover provided
-                try:
-                    console.print(f"[yellow]Generating cover art (costs API credits)...[/yellow]")
-                    progress.update(task, description="Generating cover art...")
-
-                    cover_task_id = client.generate_cover(task_id)
-                    console.print(f"[green]✓[/green] Cover generation started (Task ID: {cover_task_id})")
-
-                    # Wait for cover generation
-                    progress.update(task, description="Waiting for cover generation...")
-                    generated_cover_urls, cover_metadata = client.get_cover_urls(cover_task_id)
-
-                    console.print(f"[green]✓[/green] Cover generated! Found {len(generated_cover_urls)} variant(s)")
-
-                    # Download cover variants
-                    for idx, cover_url in enumerate(generated_cover_urls, 1):
-                        cover_file = output_path / f"cover_{idx}.jpg"
-                        progress.update(task, description=f"Downloading cover {idx}...")
-                        client.download_audio(cover_url, str(cover_file))  # Reuse download function
-                        console.print(f"[green]✓[/green] Cover saved: {cover_file.name}")
-
-                except SunoAPIError as e:
-                    console.print(f"[yellow]Warning: Cover generation failed: {e}[/yellow]")
-                    console.print(f"[yellow]Continuing with song-embedded cover...[/yellow]")
-
             # Extract tag information from metadata
             tag_info = extract_tags_from_metadata(metadata)
 
-            # Determine which cover to use for MP3 embedding
-            # Priority: custom --cover > first generated cover > API song cover
-            cover_for_embedding = cover
-            if not cover_for_embedding and generated_cover_urls:
-                # Use first generated cover
-                cover_for_embedding = str(output_path / "cover_1.jpg")
-
-            # Download audio files
-            for idx, url in enumerate(audio_urls, 1):
-                progress.update(task, description=f"Downloading variant {idx}/{len(audio_urls)}...")
-
+            # Name all variants up front, then download them concurrently
+            # while the cover art is generated
+            variants = []
+            for idx in range(1, len(audio_urls) + 1):
                 # Determine track number for filename
                 # Priority: --track option > auto-numbering (if multiple variants) > None
                 track_num = track if track is not None else (idx if len(audio_urls) > 1 else None)
@@ -359,43 +832,110 @@ def generate(
                     track=track_num,
                     variant=idx
                 )
-                output_file = output_path / filename
-                client.download_audio(url, str(output_file))
+                variants.append((idx, output_path / filename, track_num))
+
+            # Never let two concurrent downloads write the same file
+            unique = unique_output_paths([output_file for _, output_file, _ in variants])
+            variants = [
+                (idx, output_file, track_num)
+                for (idx, _, track_num), output_file in zip(variants, unique)
+            ]
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                audio_download = executor.submit(
+                    client.download_all,
+                    [
+                        (url, str(output_file))
+                        for url, (_, output_file, _) in zip(audio_urls, variants)
+                    ]
+                )
+
+                # Generate cover art if requested (costs additional credits!)
+                generated_cover_urls = []
+                cover_files = []
+                if generate_cover and not cover:  # Only if no custom cover provided
+                    try:
+                        console.print(f"[yellow]Generating cover art (costs API credits)...[/yellow]")
+                        progress.update(task, description="Generating cover art...")
+
+                        cover_task_id = metadata.get('coverTaskId') or client.generate_cover(task_id)
+                        console.print(f"[green]✓[/green] Cover generation started (Task ID: {cover_task_id})")
+
+                        # Wait for cover generation
+                        progress.update(task, description="Waiting for cover generation...")
+                        generated_cover_urls, cover_metadata = client.get_cover_urls(cover_task_id)
+
+                        console.print(f"[green]✓[/green] Cover generated! Found {len(generated_cover_urls)} variant(s)")
+
+                        # Download the selected cover variants concurrently, keep
+                        # the URLs of the others in the metadata for later
+                        count = _cover_download_count(covers_download, len(generated_cover_urls))
+                        cover_files = [
+                            output_path / f"cover_{idx}.jpg" for idx in range(1, count + 1)
+                        ]
+                        progress.update(task, description="Downloading covers...")
+                        client.download_all(list(zip(generated_cover_urls, map(str, cover_files))))  # Reuse download function
+                        for cover_file in cover_files:
+                            console.print(f"[green]✓[/green] Cover saved: {cover_file.name}")
+                        if count < len(generated_cover_urls):
+                            metadata['additional_cover_urls'] = generated_cover_urls[count:]
+
+                    except SunoAPIError as e:
+                        cover_files = []
+                        console.print(f"[yellow]Warning: Cover generation failed: {e}[/yellow]")
+                        console.print(f"[yellow]Continuing with song-embedded cover...[/yellow]")
+
+                progress.update(task, description=f"Downloading {len(audio_urls)} variant(s)...")
+                audio_download.result()
+
+            # Determine which cover to use for MP3 embedding
+            # Priority: custom --cover > first generated cover > API song cover
+            cover_for_embedding = cover
+            if not cover_for_embedding and cover_files:
+                # Use first generated cover
+                cover_for_embedding = str(cover_files[0])
+
+            # Year tag (current year) and cover art, shared by all variants
+            # Cover priority: custom file > generated cover > API song cover URL
+            current_year = str(datetime.now().year)
+            cover_data = None
+            if not no_tags:
+                cover_data = load_cover(
+                    cover_file=cover_for_embedding,
+                    cover_url=tag_info.get('cover_url') if not cover_for_embedding else None
+                )
 
+            # Set ID3 tags on all variants at once (unless disabled)
+            tag_errors: List[Optional[Exception]] = [None] * len(variants)
+            if not no_tags:
+                progress.update(task, description=f"Setting ID3 tags for {len(variants)} variant(s)...")
+                tag_errors = [error for _, error in tag_many([
+                    {
+                        'mp3_file': str(output_file),
+                        'title': tag_info.get('title') or title,
+                        'artist': artist,
+                        'album': album,
+                        'genre': tag_info.get('genre'),
+                        'year': current_year,
+                        'track_number': track_num,
+                        'cover_data': cover_data,
+                    }
+                    for _, output_file, track_num in variants
+                ])]
+
+            # Results are aligned with the variants, not keyed by path
+            for (_, output_file, _), error in zip(variants, tag_errors):
                 console.print(f"[green]✓[/green] Downloaded: {output_file}")
 
-                # Set ID3 tags (unless disabled)
                 if not no_tags:
-                    try:
-                        progress.update(task, description=f"Setting ID3 tags for variant {idx}...")
-
-                        # Determine year (current year)
-                        from datetime import datetime
-                        current_year = str(datetime.now().year)
-
-                        # Set tags
-                        # Cover priority: custom file > generated cover > API song cover URL
-                        set_id3_tags(
-                            mp3_file=str(output_file),
-                            title=tag_info.get('title') or title,
-                            artist=artist,
-                            album=album,
-                            genre=tag_info.get('genre'),
-                            year=current_year,
-                            track_number=track_num,
-                            cover_url=tag_info.get('cover_url') if not cover_for_embedding else None,
-                            cover_file=cover_for_embedding
-                        )
-
+                    if error is None:
                         console.print(f"[green]✓[/green] Tags set: {output_file.name}")
-
-                    except TaggingError as e:
-                        console.print(f"[yellow]Warning: Could not set tags for {output_file.name}: {e}[/yellow]")
+                    else:
+                        console.print(f"[yellow]Warning: Could not set tags for {output_file.name}: {error}[/yellow]")
 
             # Save metadata
             metadata_file = output_path / f"metadata-{task_id}.json"
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2)
+            write_metadata(metadata_file, metadata)
 
             console.print(f"[green]✓[/green] Metadata saved: {metadata_file.name}")
 
@@ -427,12 +967,16 @@ def download(ctx, task_id: str, output: str, filename_format: Optional[str], api
     # Get config
     config = ctx.obj.get('config', Config())
 
-    # Apply config defaults
-    if not api_key:
-        api_key = config.get('api_key') or os.getenv('SUNO_API_KEY')
-
-    if not output:
-        output = config.get('default_output_dir')
+    # Apply config defaults (Priority: CLI args > config file > hardcoded defaults)
+    options = config.resolve({
+        'api_key': api_key,
+        'default_output_dir': output,
+        'filename_format': filename_format,
+    })
+    api_key = options['api_key'] or os.getenv('SUNO_API_KEY')
+    output = options['default_output_dir']
+    filename_format = options['filename_format']
+    artist = options['default_artist']
 
     if not output:
         console.print("[red]Error: Output directory required[/red]")
@@ -444,19 +988,13 @@ def download(ctx, task_id: str, output: str, filename_format: Optional[str], api
         console.print("Set it in config file, environment variable, or use --api-key option")
         sys.exit(1)
 
-    filename_format = filename_format or config.get('filename_format', '{track} - {artist} - {title} ({variant}).mp3')
-
     output_path = Path(output)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    client = SunoClient(api_key)
+    client = SunoClient(api_key, download_session=_SESSION)
 
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
+        with _progress() as progress:
             task = progress.add_task("Checking task status...", total=None)
 
             status = client.get_status(task_id)
@@ -478,42 +1016,34 @@ def download(ctx, task_id: str, output: str, filename_format: Optional[str], api
                 sys.exit(1)
 
             # Extract audio URLs, trying multiple field names
-            audio_urls = []
-            for item in suno_data:
-                # Try in order of preference: audioUrl > sourceAudioUrl > streamAudioUrl > sourceStreamAudioUrl
-                url = (item.get('audioUrl') or
-                       item.get('sourceAudioUrl') or
-                       item.get('audio_url') or
-                       item.get('streamAudioUrl') or
-                       item.get('sourceStreamAudioUrl') or
-                       '')
-                if url:
-                    audio_urls.append(url)
+            audio_urls = extract_audio_urls(suno_data)
 
             console.print(f"[green]✓[/green] Found {len(audio_urls)} audio file(s)")
 
             # Extract metadata for filename formatting
             tag_info = extract_tags_from_metadata(data)
 
-            for idx, url in enumerate(audio_urls, 1):
-                progress.update(task, description=f"Downloading file {idx}/{len(audio_urls)}...")
-
-                # Format filename
-                filename = format_filename(
+            output_files = [
+                output_path / format_filename(
                     filename_format,
                     title=tag_info.get('title'),
-                    artist=config.get('default_artist', 'Suno AI'),
+                    artist=artist,
                     track=idx if len(audio_urls) > 1 else None,
                     variant=idx
                 )
-                output_file = output_path / filename
-                client.download_audio(url, str(output_file))
+                for idx in range(1, len(audio_urls) + 1)
+            ]
+            # Never let two concurrent downloads write the same file
+            output_files = unique_output_paths(output_files)
+
+            progress.update(task, description=f"Downloading {len(audio_urls)} file(s)...")
+            client.download_all(list(zip(audio_urls, map(str, output_files))))
 
+            for output_file in output_files:
                 console.print(f"[green]✓[/green] Downloaded: {output_file}")
 
             metadata_file = output_path / f"metadata-{task_id}.json"
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            write_metadata(metadata_file, data)
 
             console.print(f"[green]✓[/green] Metadata saved: {metadata_file.name}")
 
@@ -538,56 +1068,52 @@ def process_song_download(
     poll_interval: int,
     max_wait: int,
     progress_task=None,
-    progress_obj=None
+    progress_obj=None,
+    covers_download: str = 'first',
+    completion: Optional[Tuple[List[str], Dict]] = None,
+    poll_schedule: Optional[Tuple[float, ...]] = None,
+    cover_cache: Optional[Dict[str, Optional[bytes]]] = None,
+    claimed_paths: Optional[Set[str]] = None
 ) -> tuple[int, int]:
     """
     Download and process a completed song task
 
+    Waits for the task unless its (audio_urls, metadata) completion was
+    already obtained by the caller. output_path must already exist.
+    Custom cover files are read through cover_cache, a dict shared by the
+    songs of a batch, so an album-wide cover is read only once.
+    claimed_paths is the batch-wide set of unique_output_paths(), so songs
+    downloaded concurrently into one directory never share a file.
+
     Returns:
         tuple of (completed_count, failed_count)
     """
     try:
-        # Wait for completion
-        if progress_obj and progress_task:
-            progress_obj.update(progress_task, description=f"Waiting for '{title}'...")
-
-        audio_urls, metadata = client.wait_for_completion(
-            task_id,
-            poll_interval=poll_interval,
-            max_wait=max_wait
-        )
-
-        if progress_obj and progress_task:
-            progress_obj.update(progress_task, description=f"Completed '{title}', downloading...")
-
-        # Create output directory
-        output_path.mkdir(parents=True, exist_ok=True)
-
-        # Generate cover if requested
-        generated_cover_urls = []
-        if generate_cover and not cover:
-            try:
-                cover_task_id = client.generate_cover(task_id)
-                generated_cover_urls, _ = client.get_cover_urls(cover_task_id)
-
-                # Download cover variants
-                for cover_idx, cover_url in enumerate(generated_cover_urls, 1):
-                    cover_file = output_path / f"cover_{cover_idx}.jpg"
-                    client.download_audio(cover_url, str(cover_file))
+        if completion is not None:
+            audio_urls, metadata = completion
+        else:
+            # Wait for completion
+            if progress_obj is not None and progress_task is not None:
+                progress_obj.update(progress_task, description=f"Waiting for '{title}'...")
 
-            except SunoAPIError:
-                pass  # Silently continue without generated cover
+            audio_urls, metadata = client.wait_for_completion(
+                task_id,
+                poll_interval=poll_interval,
+                max_wait=max_wait,
+                auto_cover=generate_cover and not cover,
+                poll_schedule=poll_schedule
+            )
 
-        # Determine cover for embedding
-        cover_for_embedding = cover
-        if not cover_for_embedding and generated_cover_urls:
-            cover_for_embedding = str(output_path / "cover_1.jpg")
+        if progress_obj is not None and progress_task is not None:
+            progress_obj.update(progress_task, description=f"Completed '{title}', downloading...")
 
         # Extract tag information
         tag_info = extract_tags_from_metadata(metadata)
 
-        # Download audio files
-        for audio_idx, url in enumerate(audio_urls, 1):
+        # Name all variants up front, then download them concurrently
+        # while the cover art is generated
+        variants = []
+        for audio_idx in range(1, len(audio_urls) + 1):
             # Determine track number for filename
             track_num = track if track is not None else (audio_idx if len(audio_urls) > 1 else None)
 
@@ -599,32 +1125,75 @@ def process_song_download(
                 track=track_num,
                 variant=audio_idx
             )
-            output_file = output_path / filename
-            client.download_audio(url, str(output_file))
+            variants.append((output_path / filename, track_num))
+
+        # Never let two concurrent downloads write the same file
+        unique = unique_output_paths([output_file for output_file, _ in variants], claimed_paths)
+        variants = [
+            (output_file, track_num) for (_, track_num), output_file in zip(variants, unique)
+        ]
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            audio_download = executor.submit(
+                client.download_all,
+                [(url, str(output_file)) for url, (output_file, _) in zip(audio_urls, variants)]
+            )
 
-            # Set ID3 tags
-            try:
-                from datetime import datetime
-                current_year = str(datetime.now().year)
+            # Generate cover if requested
+            cover_files = []
+            if generate_cover and not cover:
+                try:
+                    cover_task_id = metadata.get('coverTaskId') or client.generate_cover(task_id)
+                    generated_cover_urls, _ = client.get_cover_urls(cover_task_id)
+
+                    # Download the selected cover variants concurrently
+                    count = _cover_download_count(covers_download, len(generated_cover_urls))
+                    cover_files = unique_output_paths(
+                        [output_path / f"cover_{idx}.jpg" for idx in range(1, count + 1)],
+                        claimed_paths
+                    )
+                    client.download_all(list(zip(generated_cover_urls, map(str, cover_files))))
+                    if count < len(generated_cover_urls):
+                        metadata['additional_cover_urls'] = generated_cover_urls[count:]
 
-                set_id3_tags(
-                    mp3_file=str(output_file),
-                    title=tag_info.get('title') or title,
-                    artist=artist,
-                    album=album,
-                    genre=tag_info.get('genre'),
-                    year=current_year,
-                    track_number=track_num,
-                    cover_url=tag_info.get('cover_url') if not cover_for_embedding else None,
-                    cover_file=cover_for_embedding
-                )
-            except TaggingError:
-                pass  # Continue without tags
+                except SunoAPIError:
+                    cover_files = []  # Silently continue without generated cover
+
+            audio_download.result()
+
+        # Determine cover for embedding
+        cover_for_embedding = cover
+        if not cover_for_embedding and cover_files:
+            cover_for_embedding = str(cover_files[0])
+
+        current_year = str(datetime.now().year)
+        if cover and cover_cache is not None:
+            if cover not in cover_cache:
+                cover_cache[cover] = load_cover(cover_file=cover)
+            cover_data = cover_cache[cover]
+        else:
+            cover_data = load_cover(
+                cover_file=cover_for_embedding,
+                cover_url=tag_info.get('cover_url') if not cover_for_embedding else None
+            )
+        # Set ID3 tags on all variants at once, failures leave a file untagged
+        tag_many([
+            {
+                'mp3_file': str(output_file),
+                'title': tag_info.get('title') or title,
+                'artist': artist,
+                'album': album,
+                'genre': tag_info.get('genre'),
+                'year': current_year,
+                'track_number': track_num,
+                'cover_data': cover_data,
+            }
+            for output_file, track_num in variants
+        ])
 
         # Save metadata
         metadata_file = output_path / f"metadata-{task_id}.json"
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2)
+        write_metadata(metadata_file, metadata)
 
         console.print(f"[green]✓[/green] {title} -> {output_path}")
         return (1, 0)  # 1 completed, 0 failed
@@ -635,15 +1204,21 @@ def process_song_download(
 
 
 @cli.command()
-@click.argument('batch_file', type=click.Path(exists=True))
+@click.argument('batch_file', type=str)
 @click.option('--output-base', '-o', type=click.Path(), help='Base output directory (each song gets a subdirectory)')
 @click.option('--parallel', '-p', is_flag=True, help='Generate songs in parallel (starts all at once)')
 @click.option('--interactive', '-i', is_flag=True, help='Ask before processing each song (sequential mode only)')
 @click.option('--delay', '-d', type=int, default=0, help='Delay in seconds between starting each song (ignored with --parallel)')
+@click.option('--concurrency', type=click.IntRange(min=1), default=4,
+              help='Maximum number of finished songs downloaded at once with --parallel '
+                   '(default: 4)')
+@click.option('--covers-download', type=click.Choice(['all', 'first', 'none']), default='first',
+              help='Generated cover variants to download per song '
+                   '(default: first, others are listed in the metadata)')
 @click.option('--filename-format', help='Filename format (default: "{track} - {artist} - {title} ({variant}).mp3"). Placeholders: {track}, {artist}, {title}, {variant}')
 @click.option('--api-key', envvar='SUNO_API_KEY', help='Suno API key (or set SUNO_API_KEY env var)')
 @click.pass_context
-def batch(ctx, batch_file: str, output_base: Optional[str], parallel: bool, interactive: bool, delay: int, filename_format: Optional[str], api_key: Optional[str]):
+def batch(ctx, batch_file: str, output_base: Optional[str], parallel: bool, interactive: bool, delay: int, concurrency: int, covers_download: str, filename_format: Optional[str], api_key: Optional[str]):
     """
     Generate multiple songs from a YAML batch file
 
@@ -708,28 +1283,25 @@ def batch(ctx, batch_file: str, output_base: Optional[str], parallel: bool, inte
         # From URL
         suno batch https://example.com/album.yaml
     """
-    import yaml
-    import time as time_module
-    from datetime import datetime
-
     # Get config
     config = ctx.obj.get('config', Config())
 
-    # Apply config defaults
-    if not api_key:
-        api_key = config.get('api_key') or os.getenv('SUNO_API_KEY')
+    # Apply config defaults (Priority: CLI args > config file > hardcoded defaults)
+    options = config.resolve({
+        'api_key': api_key,
+        'filename_format': filename_format,
+    })
+    api_key = options['api_key'] or os.getenv('SUNO_API_KEY')
+    filename_format = options['filename_format']
 
     if not api_key:
         console.print("[red]Error: SUNO_API_KEY not found[/red]")
         console.print("Set it in config file, environment variable, or use --api-key option")
         sys.exit(1)
 
-    filename_format = filename_format or config.get('filename_format', '{track} - {artist} - {title} ({variant}).mp3')
-
     # Load batch YAML (supports files and URLs)
     try:
-        yaml_content = load_content(batch_file, "batch YAML")
-        batch_data = yaml.safe_load(yaml_content)
+        batch_data = load_yaml_content(batch_file, "batch YAML", allow_string=False)
     except Exception as e:
         console.print(f"[red]Error loading batch file: {e}[/red]")
         sys.exit(1)
@@ -743,7 +1315,7 @@ def batch(ctx, batch_file: str, output_base: Optional[str], parallel: bool, inte
     # Get global settings from YAML
     yaml_output_base = batch_data.get('output_base')
     use_subdirectories = batch_data.get('use_subdirectories', True)
-    yaml_defaults = batch_data.get('defaults', {})
+    batch_defaults = _song_options(batch_data.get('defaults') or {})
 
     # Determine final output_base
     # Priority: CLI --output-base > YAML output_base > config default_output_dir
@@ -754,7 +1326,18 @@ def batch(ctx, batch_file: str, output_base: Optional[str], parallel: bool, inte
         console.print("Specify in YAML (output_base), CLI (-o), or config file (default_output_dir)")
         sys.exit(1)
 
-    console.print(f"[bold]Batch Generation[/bold]: {len(songs)} song(s)")
+    base_path = Path(final_output_base)
+
+    # Validate every song before the first (billed) API call
+    try:
+        specs = build_song_specs(songs, config, batch_defaults, base_path, use_subdirectories)
+    except ConfigError as e:
+        for message in str(e).splitlines():
+            console.print(f"[red]Error: {message}[/red]")
+        sys.exit(1)
+
+    total = len(songs)
+    console.print(f"[bold]Batch Generation[/bold]: {total} song(s)")
     console.print(f"[dim]Mode: {'Parallel' if parallel else 'Sequential'}[/dim]")
     console.print(f"[dim]Output: {final_output_base} (subdirectories: {use_subdirectories})[/dim]")
 
@@ -762,7 +1345,7 @@ def batch(ctx, batch_file: str, output_base: Optional[str], parallel: bool, inte
     if interactive and parallel:
         console.print("[yellow]Warning: --interactive is ignored in parallel mode[/yellow]")
         interactive = False
-    elif interactive and len(songs) == 1:
+    elif interactive and total == 1:
         # No point asking if only 1 song
         interactive = False
 
@@ -771,19 +1354,40 @@ def batch(ctx, batch_file: str, output_base: Optional[str], parallel: bool, inte
 
     console.print()  # Empty line
 
-    batch_start_time = datetime.now()
+    # Monotonic clock, unaffected by wall-clock adjustments mid-batch
+    batch_start_time = time.perf_counter()
 
     # Initialize client
-    callback_url = config.get('callback_url')
-    client = SunoClient(api_key, callback_url=callback_url if callback_url else None)
+    callback_url = options['callback_url']
+    client = SunoClient(
+        api_key,
+        callback_url=callback_url if callback_url else None,
+        download_session=_SESSION
+    )
+
+    # Connect to the API in the background while the first song's content loads
+    threading.Thread(target=client.warm_up, daemon=True).start()
 
     # Get poll settings from config
-    poll_interval = config.get('poll_interval', 10)
-    max_wait = config.get('max_wait', 600)
+    poll_interval = options['poll_interval']
+    max_wait = options['max_wait']
+    poll_schedule = _poll_schedule(config)
 
     completed = 0
     failed = 0
 
+    # Load every song's prompt and style before the first generation, so an
+    # unreadable file stops the batch before anything is billed. Shared
+    # sources are read only once.
+    content_cache: Dict[str, str] = {}
+    song_requests = [spec.load_request(content_cache) for spec in specs]
+
+    # Custom covers, read once per batch when the songs are tagged
+    cover_cache: Dict[str, Optional[bytes]] = {}
+
+    # Output files claimed so far, songs sharing a directory get distinct names
+    claimed_paths: Set[str] = set()
+
     if parallel:
         # ===== PARALLEL MODE =====
         # Start all songs at once, then wait/download all
@@ -791,235 +1395,145 @@ def batch(ctx, batch_file: str, output_base: Optional[str], parallel: bool, inte
 
         tasks = []
 
-        # Start all generations
-        for idx, song_def in enumerate(songs, 1):
-            # Helper function to get value with priority: song > yaml defaults > config
-            def get_param(key, config_key=None, fallback=None):
-                """Get parameter with priority: song > yaml defaults > config > fallback"""
-                if key in song_def and song_def[key] is not None:
-                    return song_def[key]
-                if key in yaml_defaults and yaml_defaults[key] is not None:
-                    return yaml_defaults[key]
-                if config_key:
-                    return config.get(config_key, fallback)
-                return fallback
-
-            # Extract song parameters
-            title = song_def.get('title')
-            prompt_param = get_param('prompt')
-            style_param = get_param('style')
-            output_dir = song_def.get('output')
-            model = get_param('model', 'default_model', 'V4_5ALL')
-            gender = get_param('gender', 'default_gender', 'male')
-            instrumental = get_param('instrumental', fallback=False)
-            duration = get_param('duration')
-            cover = get_param('cover')
-            generate_cover = get_param('generate_cover', fallback=False)
-            artist = get_param('artist', 'default_artist', 'Suno AI')
-            album = get_param('album', 'default_album')
-            track = song_def.get('track') or idx
-
-            # Determine output directory
-            if output_dir:
-                output_path = Path(output_dir)
-                if not output_path.is_absolute():
-                    output_path = Path(final_output_base) / output_dir
-            else:
-                if use_subdirectories:
-                    output_path = Path(final_output_base) / f"song_{idx:02d}"
-                else:
-                    output_path = Path(final_output_base)
-
-            # Validate required fields
-            if not title:
-                console.print(f"[red]Error: Song {idx} missing required field 'title'[/red]")
-                sys.exit(1)
-            if not prompt_param:
-                console.print(f"[red]Error: Song {idx} missing 'prompt' field[/red]")
-                sys.exit(1)
-            if not style_param:
-                console.print(f"[red]Error: Song {idx} missing 'style' field[/red]")
-                sys.exit(1)
+        # Submit every song at once, reporting each phase as a single block
+        console.print(*(
+            f"[cyan]{spec.index}/{total}[/cyan] Starting: [bold]{spec.title}[/bold]"
+            for spec in specs
+        ), sep="\n")
 
-            # Load content
-            lyrics_text = load_content(prompt_param, f"prompt for song {idx}")
-            style_text = load_content(style_param, f"style for song {idx}")
-
-            # Start generation
-            console.print(f"[cyan]{idx}/{len(songs)}[/cyan] Starting: [bold]{title}[/bold]")
-
-            try:
-                task_id = client.generate_song(
-                    lyrics=lyrics_text,
-                    title=title,
-                    style=style_text,
-                    model=model,
-                    vocal_gender=gender,
-                    instrumental=instrumental,
-                    duration=duration,
-                    custom_mode=True
-                )
+        results = client.generate_songs(song_requests, max_workers=16)
 
-                tasks.append({
-                    'task_id': task_id,
-                    'title': title,
-                    'output_path': output_path,
-                    'cover': cover,
-                    'generate_cover': generate_cover,
-                    'artist': artist,
-                    'album': album,
-                    'track': track,
-                })
-
-                console.print(f"  [green]✓[/green] Task ID: {task_id}")
-
-            except SunoAPIError as e:
-                console.print(f"  [red]✗ Failed: {e}[/red]")
+        lines = []
+        for spec, result in zip(specs, results):
+            if isinstance(result, SunoAPIError):
+                lines.append(f"  [red]✗ {spec.title}: Failed: {result}[/red]")
                 failed += 1
-                continue
+            else:
+                tasks.append((result, spec))
+                lines.append(f"  [green]✓[/green] {spec.title}: Task ID: {result}")
+        console.print(*lines, sep="\n")
 
         if not tasks:
             console.print("[red]No songs were started successfully[/red]")
             sys.exit(1)
 
+        # Only songs that started get an output directory
+        for song_path in {spec.output_path for _, spec in tasks}:
+            song_path.mkdir(parents=True, exist_ok=True)
+
         console.print(f"\n[green]✓[/green] Started {len(tasks)} generation(s)")
         console.print("[dim]Waiting for all songs to complete...[/dim]\n")
 
-        # Wait for all completions and download
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            for task_info in tasks:
-                progress_task = progress.add_task("", total=None)
-
-                comp, fail = process_song_download(
-                    client=client,
-                    task_id=task_info['task_id'],
-                    title=task_info['title'],
-                    output_path=task_info['output_path'],
-                    cover=task_info['cover'],
-                    generate_cover=task_info['generate_cover'],
-                    artist=task_info['artist'],
-                    album=task_info['album'],
-                    track=task_info['track'],
-                    filename_format=filename_format,
-                    poll_interval=poll_interval,
-                    max_wait=max_wait,
-                    progress_task=progress_task,
-                    progress_obj=progress
-                )
-                completed += comp
-                failed += fail
+        # Poll all songs together and download each as soon as it finishes,
+        # so a slow song does not hold back songs that already finished
+        specs_by_task = dict(tasks)
+        cover_tasks = [task_id for task_id, spec in tasks if spec.generate_cover and not spec.cover]
+
+        executor = ThreadPoolExecutor(max_workers=min(concurrency, len(tasks)))
+        futures = []
+        polled = 0
+        try:
+            with _progress() as progress:
+                waiting = progress.add_task(f"Waiting for {len(tasks)} song(s)...", total=None)
+
+                for task_id, result in client.iter_completed(
+                    list(specs_by_task), poll_interval=poll_interval, max_wait=max_wait,
+                    auto_cover=cover_tasks, poll_schedule=poll_schedule
+                ):
+                    spec = specs_by_task[task_id]
+                    polled += 1
+                    if isinstance(result, SunoAPIError):
+                        console.print(f"[red]✗[/red] {spec.title}: {result}")
+                        failed += 1
+                    else:
+                        futures.append(executor.submit(
+                            process_song_download,
+                            client=client,
+                            task_id=task_id,
+                            **spec.download_options(),
+                            filename_format=filename_format,
+                            poll_interval=poll_interval,
+                            max_wait=max_wait,
+                            covers_download=covers_download,
+                            completion=result,
+                            cover_cache=cover_cache,
+                            claimed_paths=claimed_paths
+                        ))
+
+                    progress.update(
+                        waiting, description=f"Waiting for {len(tasks) - polled} song(s)..."
+                    )
+
+                progress.update(waiting, description="Downloading finished songs...")
+                for future in as_completed(futures):
+                    comp, fail = future.result()
+                    completed += comp
+                    failed += fail
+        except KeyboardInterrupt:
+            # Drop queued downloads, only the ones already running are finished
+            for future in futures:
+                future.cancel()
+            console.print("\n[yellow]Cancelled by user[/yellow]")
+            console.print(f"[dim]Completed: {completed}/{total}, Failed: {failed}/{total}[/dim]")
+            sys.exit(130)
+        finally:
+            executor.shutdown()
 
     else:
         # ===== SEQUENTIAL MODE =====
         # Process each song completely before starting the next
         console.print("[dim]Processing songs sequentially...[/dim]\n")
 
-        # Track if user selected "All" mode
-        interactive_all_mode = False
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            for idx, song_def in enumerate(songs, 1):
-                # Helper function to get value with priority: song > yaml defaults > config
-                def get_param(key, config_key=None, fallback=None):
-                    """Get parameter with priority: song > yaml defaults > config > fallback"""
-                    if key in song_def and song_def[key] is not None:
-                        return song_def[key]
-                    if key in yaml_defaults and yaml_defaults[key] is not None:
-                        return yaml_defaults[key]
-                    if config_key:
-                        return config.get(config_key, fallback)
-                    return fallback
-
-                # Extract song parameters
-                title = song_def.get('title')
-                prompt_param = get_param('prompt')
-                style_param = get_param('style')
-                output_dir = song_def.get('output')
-                model = get_param('model', 'default_model', 'V4_5ALL')
-                gender = get_param('gender', 'default_gender', 'male')
-                instrumental = get_param('instrumental', fallback=False)
-                duration = get_param('duration')
-                cover = get_param('cover')
-                generate_cover = get_param('generate_cover', fallback=False)
-                artist = get_param('artist', 'default_artist', 'Suno AI')
-                album = get_param('album', 'default_album')
-                track = song_def.get('track') or idx
-
-                # Determine output directory
-                if output_dir:
-                    output_path = Path(output_dir)
-                    if not output_path.is_absolute():
-                        output_path = Path(final_output_base) / output_dir
-                else:
-                    if use_subdirectories:
-                        output_path = Path(final_output_base) / f"song_{idx:02d}"
-                    else:
-                        output_path = Path(final_output_base)
+        # Ask after each song until the user selects "All"
+        should_prompt = interactive
 
-                # Validate required fields
-                if not title:
-                    console.print(f"[red]Error: Song {idx} missing required field 'title'[/red]")
-                    sys.exit(1)
-                if not prompt_param:
-                    console.print(f"[red]Error: Song {idx} missing 'prompt' field[/red]")
-                    sys.exit(1)
-                if not style_param:
-                    console.print(f"[red]Error: Song {idx} missing 'style' field[/red]")
-                    sys.exit(1)
+        # Start time of the previous song, --delay is measured between starts
+        # so the time spent generating and downloading counts towards it
+        last_start = None
+
+        with _progress() as progress:
+            for spec, song_request in zip(specs, song_requests):
+                idx = spec.index
 
-                # Load content
-                lyrics_text = load_content(prompt_param, f"prompt for song {idx}")
-                style_text = load_content(style_param, f"style for song {idx}")
+                # Delay before this song (if configured)
+                if last_start is not None and delay > 0:
+                    remaining = delay - (time.monotonic() - last_start)
+                    if remaining > 0:
+                        console.print(f"  [dim]Waiting {remaining:.0f}s before next song...[/dim]")
+                        time.sleep(remaining)
+                last_start = time.monotonic()
 
                 # Start generation
-                console.print(f"[cyan]{idx}/{len(songs)}[/cyan] Starting: [bold]{title}[/bold]")
+                console.print(f"[cyan]{idx}/{total}[/cyan] Starting: [bold]{spec.title}[/bold]")
 
                 try:
-                    progress_task = progress.add_task(f"Starting '{title}'...", total=None)
-
-                    task_id = client.generate_song(
-                        lyrics=lyrics_text,
-                        title=title,
-                        style=style_text,
-                        model=model,
-                        vocal_gender=gender,
-                        instrumental=instrumental,
-                        duration=duration,
-                        custom_mode=True
-                    )
+                    progress_task = progress.add_task(f"Starting '{spec.title}'...", total=None)
+
+                    task_id = client.generate_song(**song_request)
 
                     console.print(f"  [green]✓[/green] Task ID: {task_id}")
+                    spec.output_path.mkdir(parents=True, exist_ok=True)
 
                     # Immediately wait and download this song
                     comp, fail = process_song_download(
                         client=client,
                         task_id=task_id,
-                        title=title,
-                        output_path=output_path,
-                        cover=cover,
-                        generate_cover=generate_cover,
-                        artist=artist,
-                        album=album,
-                        track=track,
+                        **spec.download_options(),
                         filename_format=filename_format,
                         poll_interval=poll_interval,
                         max_wait=max_wait,
                         progress_task=progress_task,
-                        progress_obj=progress
+                        progress_obj=progress,
+                        covers_download=covers_download,
+                        poll_schedule=poll_schedule,
+                        cover_cache=cover_cache,
+                        claimed_paths=claimed_paths
                     )
                     completed += comp
                     failed += fail
 
                     # Interactive mode: Ask user if they want to continue
-                    if interactive and not interactive_all_mode and idx < len(songs):
+                    if should_prompt and idx < total:
                         console.print()  # Empty line for spacing
                         try:
                             response = click.prompt(
@@ -1035,25 +1549,20 @@ def batch(ctx, batch_file: str, output_base: Optional[str], parallel: bool, inte
                                 break  # Exit the loop
                             elif response == 'A':
                                 console.print("[dim]Continuing with all remaining songs...[/dim]")
-                                interactive_all_mode = True
+                                should_prompt = False
                             # Y is default, just continue
                         except (KeyboardInterrupt, click.Abort):
                             console.print("\n[yellow]Cancelled by user[/yellow]")
-                            console.print(f"[dim]Completed: {completed}/{len(songs)}, Failed: {failed}/{len(songs)}[/dim]")
+                            console.print(f"[dim]Completed: {completed}/{total}, Failed: {failed}/{total}[/dim]")
                             sys.exit(130)
                         console.print()  # Empty line for spacing
 
-                    # Delay before next song (if configured)
-                    if idx < len(songs) and delay > 0:
-                        console.print(f"  [dim]Waiting {delay}s before next song...[/dim]")
-                        time_module.sleep(delay)
-
                 except SunoAPIError as e:
                     console.print(f"  [red]✗ Failed to start: {e}[/red]")
                     failed += 1
 
                     # Also ask in interactive mode after failures
-                    if interactive and not interactive_all_mode and idx < len(songs):
+                    if should_prompt and idx < total:
                         console.print()
                         try:
                             response = click.prompt(
@@ -1069,10 +1578,10 @@ def batch(ctx, batch_file: str, output_base: Optional[str], parallel: bool, inte
                                 break
                             elif response == 'A':
                                 console.print("[dim]Continuing with all remaining songs...[/dim]")
-                                interactive_all_mode = True
+                                should_prompt = False
                         except (KeyboardInterrupt, click.Abort):
                             console.print("\n[yellow]Cancelled by user[/yellow]")
-                            console.print(f"[dim]Completed: {completed}/{len(songs)}, Failed: {failed}/{len(songs)}[/dim]")
+                            console.print(f"[dim]Completed: {completed}/{total}, Failed: {failed}/{total}[/dim]")
                             sys.exit(130)
                         console.print()
 
@@ -1080,15 +1589,15 @@ def batch(ctx, batch_file: str, output_base: Optional[str], parallel: bool, inte
 
                 except KeyboardInterrupt:
                     console.print("\n[yellow]Cancelled by user[/yellow]")
-                    console.print(f"[dim]Completed: {completed}/{len(songs)}, Failed: {failed}/{len(songs)}[/dim]")
+                    console.print(f"[dim]Completed: {completed}/{total}, Failed: {failed}/{total}[/dim]")
                     sys.exit(130)
 
     # Summary
-    batch_duration = (datetime.now() - batch_start_time).total_seconds()
+    batch_duration = time.perf_counter() - batch_start_time
     console.print(f"\n[bold green]Batch Complete![/bold green]")
-    console.print(f"[green]✓[/green] Completed: {completed}/{len(songs)}")
+    console.print(f"[green]✓[/green] Completed: {completed}/{total}")
     if failed > 0:
-        console.print(f"[red]✗[/red] Failed: {failed}/{len(songs)}")
+        console.print(f"[red]✗[/red] Failed: {failed}/{total}")
     console.print(f"[dim]Total time: {batch_duration:.1f}s[/dim]")
 
 
@@ -1145,7 +1654,7 @@ def status(ctx, task_id: str, api_key: Optional[str]):
         console.print("Set it in config file, environment variable, or use --api-key option")
         sys.exit(1)
 
-    client = SunoClient(api_key)
+    client = SunoClient(api_key, download_session=_SESSION)
 
     try:
         result = client.get_status(task_id)
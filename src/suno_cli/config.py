@@ -4,17 +4,69 @@ Configuration file management for suno-cli
 
 import os
 import re
+from collections import ChainMap
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
 
 import yaml
 
+# libyaml's C parser when PyYAML was built against it, pure Python otherwise
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# ${VAR_NAME} references substituted from the environment
+_ENV_RE = re.compile(r'\$\{([^}]+)\}')
+
+# Parsed config files by (path, mtime_ns, size), so Config instances created
+# repeatedly in one process parse an unchanged file only once. Values are
+# cached before substitution, environment variables are always read fresh.
+_RAW_CONFIG_CACHE: Dict[Tuple[str, int, int], Any] = {}
+
+
+def load_yaml(stream: Any) -> Any:
+    """
+    Safely parse YAML, using the libyaml C loader when available
+
+    Args:
+        stream: YAML string or open file
+
+    Returns:
+        Parsed YAML data
+    """
+    return yaml.load(stream, Loader=_YamlLoader)
+
 
 class ConfigError(Exception):
     """Base exception for config errors"""
     pass
 
 
+class _SubstitutedConfig(Mapping):
+    """Config file values, substituting environment variables on first access"""
+
+    def __init__(self, raw: Dict[str, Any], substitute: Callable[[Any], Any]):
+        self._raw = raw
+        self._substitute = substitute
+        self._resolved: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._resolved:
+            self._resolved[key] = self._substitute(self._raw[key])
+        return self._resolved[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._raw
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+
 class Config:
     """Configuration manager for suno-cli"""
 
@@ -31,6 +83,7 @@ class Config:
         "callback_url": None,
         "poll_interval": 10,
         "max_wait": 600,
+        "poll_schedule": None,
         "filename_format": "{track} - {artist} - {title} ({variant}).mp3",
     }
 
@@ -42,7 +95,7 @@ class Config:
             config_path: Path to config file (default: ~/.suno-cli/config.yaml)
         """
         self.config_path = Path(config_path) if config_path else self.DEFAULT_CONFIG_PATH
-        self.config_data = {}
+        self.config_data: Mapping = {}
 
         if self.config_path.exists():
             self._load_config()
@@ -50,12 +103,22 @@ class Config:
     def _load_config(self) -> None:
         """Load configuration from YAML file"""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                raw_config = yaml.safe_load(f) or {}
-
-            # Substitute environment variables
-            self.config_data = self._substitute_env_vars(raw_config)
-
+            stat = self.config_path.stat()
+            cache_key = (str(self.config_path), stat.st_mtime_ns, stat.st_size)
+            raw_config = _RAW_CONFIG_CACHE.get(cache_key)
+            if raw_config is None:
+                with open(self.config_path, 'r', encoding='utf-8') as f:
+                    raw_config = load_yaml(f) or {}
+                _RAW_CONFIG_CACHE[cache_key] = raw_config
+
+            if not isinstance(raw_config, dict):
+                raise ConfigError("Config file must contain a mapping of settings")
+
+            # Environment variables are substituted per key when it is read
+            self.config_data = _SubstitutedConfig(raw_config, self._substitute_env_vars)
+
+        except ConfigError:
+            raise
         except yaml.YAMLError as e:
             raise ConfigError(f"Invalid YAML in config file: {e}")
         except Exception as e:
@@ -72,12 +135,16 @@ class Config:
         elif isinstance(data, list):
             return [self._substitute_env_vars(item) for item in data]
         elif isinstance(data, str):
+            # Most values reference no variable, skip the regex for them
+            if '${' not in data:
+                return data
+
             # Replace ${VAR} with environment variable value
             def replace_env(match):
                 var_name = match.group(1)
                 return os.getenv(var_name, match.group(0))
 
-            return re.sub(r'\$\{([^}]+)\}', replace_env, data)
+            return _ENV_RE.sub(replace_env, data)
         else:
             return data
 
@@ -101,6 +168,30 @@ class Config:
         else:
             return default
 
+    def resolve(
+        self,
+        cli_args: Dict[str, Any],
+        song_overrides: Optional[Dict[str, Any]] = None
+    ) -> ChainMap:
+        """
+        Resolve option values through a single lookup chain
+
+        Priority: song overrides > CLI args > config file > DEFAULTS
+
+        Args:
+            cli_args: Option values keyed by config key; None means not given
+            song_overrides: Per-song values keyed by config key; None means not given
+
+        Returns:
+            ChainMap view of the resolved options; new_child() adds a layer
+            of higher priority without copying
+        """
+        layers = [
+            {k: v for k, v in values.items() if v is not None}
+            for values in (song_overrides or {}, cli_args)
+        ]
+        return ChainMap(*layers, self.config_data, self.DEFAULTS)
+
     def get_all(self) -> Dict[str, Any]:
         """
         Get all config values merged with defaults
@@ -155,8 +246,10 @@ api_key: ${SUNO_API_KEY}
 # callback_url: https://example.com/callback
 
 # Polling settings
-poll_interval: 10  # seconds between status checks
+poll_interval: 10  # initial seconds between status checks (backs off up to 30s)
 max_wait: 600      # maximum wait time in seconds
+# Fixed seconds between checks instead of the backoff (last value repeats)
+# poll_schedule: [5, 10, 20, 30]
 
 # Filename format for generated songs
 # Placeholders: {track}, {artist}, {title}, {variant}
@@ -2,12 +2,35 @@
 ID3 tag management for MP3 files
 """
 
+import os
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
-from mutagen.easyid3 import EasyID3
-from mutagen.id3 import ID3, APIC, error as ID3Error
-from mutagen.mp3 import MP3
+from typing import Optional, Dict, Any, List, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Keep-alive session for cover downloads, so tagging several variants or
+# songs reuses the connection to the image host
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=10,
+    max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+
+# Image signatures for the APIC MIME type; anything else is assumed to be JPEG
+_IMAGE_MAGIC = (
+    (b'\x89PNG', 'image/png'),
+    (b'GIF', 'image/gif'),
+)
+
+
+# Upper bound for downloaded cover images
+MAX_COVER_SIZE = 8 * 1024 * 1024
 
 
 class TaggingError(Exception):
@@ -25,10 +48,14 @@ def set_id3_tags(
     track_number: Optional[int] = None,
     cover_url: Optional[str] = None,
     cover_file: Optional[str] = None,
+    cover_data: Optional[bytes] = None,
 ) -> None:
     """
     Set ID3v2 tags for an MP3 file
 
+    When tagging several files with the same cover, load it once with
+    load_cover() and pass it as cover_data.
+
     Args:
         mp3_file: Path to MP3 file
         title: Song title
@@ -39,95 +66,172 @@ def set_id3_tags(
         track_number: Track number
         cover_url: URL to download cover art from
         cover_file: Path to local cover art file
+        cover_data: Cover image bytes (takes precedence over cover_file
+            and cover_url)
 
     Raises:
         TaggingError: If tagging fails
     """
+    # mutagen is only needed once files are tagged, keep it out of CLI startup
+    from mutagen.id3 import ID3, ID3NoHeaderError, APIC, TALB, TCON, TDRC, TIT2, TPE1, TPE2, TRCK
+
     try:
-        # Set basic tags
+        # Read the existing tag once; all frames are written in a single save
         try:
-            audio = EasyID3(mp3_file)
-        except ID3Error.ID3NoHeaderError:
+            audio = ID3(mp3_file)
+        except ID3NoHeaderError:
             # File has no ID3 tag yet, create one
-            audio = MP3(mp3_file)
-            audio.add_tags()
-            audio = EasyID3(mp3_file)
+            audio = ID3()
 
-        # Set available tags
-        audio['artist'] = artist
+        # Set available tags (encoding=3 is UTF-8)
+        text_frames = [TPE1(encoding=3, text=artist)]
         if title:
-            audio['title'] = title
+            text_frames.append(TIT2(encoding=3, text=title))
         if album:
-            audio['album'] = album
-            audio['albumartist'] = artist
+            text_frames.append(TALB(encoding=3, text=album))
+            text_frames.append(TPE2(encoding=3, text=artist))
         if genre:
-            audio['genre'] = genre
+            text_frames.append(TCON(encoding=3, text=genre))
         if year:
-            audio['date'] = year
+            text_frames.append(TDRC(encoding=3, text=year))
         if track_number:
-            audio['tracknumber'] = str(track_number)
-
-        audio.save()
+            text_frames.append(TRCK(encoding=3, text=str(track_number)))
+        for frame in text_frames:
+            audio.setall(frame.FrameID, [frame])
 
         # Add cover art if provided
-        cover_data = None
-
-        # Priority: custom file/URL > URL from API
-        if cover_file:
-            # Check if it's a URL
-            if cover_file.startswith(('http://', 'https://')):
-                try:
-                    response = requests.get(cover_file, timeout=30)
-                    response.raise_for_status()
-                    cover_data = response.content
-                except Exception as e:
-                    print(f"Warning: Could not download cover from URL: {e}")
-            # Check if it's a local file
-            elif Path(cover_file).exists():
-                with open(cover_file, 'rb') as f:
-                    cover_data = f.read()
-            else:
-                print(f"Warning: Cover file not found: {cover_file}")
-        elif cover_url:
-            # Download cover from API URL
-            try:
-                response = requests.get(cover_url, timeout=30)
-                response.raise_for_status()
-                cover_data = response.content
-            except Exception as e:
-                # Don't fail if cover download fails, just skip it
-                print(f"Warning: Could not download cover art: {e}")
+        if cover_data is None:
+            cover_data = load_cover(cover_file=cover_file, cover_url=cover_url)
 
         if cover_data:
             try:
-                audio_full = ID3(mp3_file)
-                audio_full.delall("APIC")  # Remove existing covers
-
                 # Detect image format from data
                 mime_type = 'image/jpeg'
-                if cover_data.startswith(b'\x89PNG'):
-                    mime_type = 'image/png'
-                elif cover_data.startswith(b'GIF'):
-                    mime_type = 'image/gif'
-
-                audio_full.add(
-                    APIC(
-                        encoding=3,  # UTF-8
-                        mime=mime_type,
-                        type=3,  # Cover (front)
-                        desc='Cover',
-                        data=cover_data
-                    )
+                for magic, image_mime in _IMAGE_MAGIC:
+                    if cover_data.startswith(magic):
+                        mime_type = image_mime
+                        break
+
+                cover_frame = APIC(
+                    encoding=3,  # UTF-8
+                    mime=mime_type,
+                    type=3,  # Cover (front)
+                    desc='Cover',
+                    data=cover_data
                 )
-                audio_full.save()
+                audio.delall("APIC")  # Remove existing covers
+                audio.add(cover_frame)
             except Exception as e:
                 # Don't fail if cover embedding fails
                 print(f"Warning: Could not embed cover art: {e}")
 
+        audio.save(mp3_file)
+
     except Exception as e:
         raise TaggingError(f"Failed to set ID3 tags: {e}")
 
 
+def tag_many(
+    items: List[Dict[str, Any]],
+    max_workers: int = 8
+) -> List[Tuple[str, Optional[TaggingError]]]:
+    """
+    Set ID3 tags on several MP3 files concurrently
+
+    Pass the cover as pre-loaded cover_data (see load_cover()) so it is
+    read or downloaded once rather than by every worker. Items naming the
+    same file are tagged one after another by a single worker, so two
+    workers never load and save one file at once.
+
+    Args:
+        items: List of keyword argument dicts for set_id3_tags()
+        max_workers: Maximum number of files tagged at once
+
+    Returns:
+        List aligned with items of (mp3_file, error) tuples; error is the
+        TaggingError if that item could not be tagged, None otherwise
+    """
+    if not items:
+        return []
+
+    # Indexes of the items per file, in order
+    groups: Dict[str, List[int]] = {}
+    for index, item in enumerate(items):
+        groups.setdefault(os.path.abspath(item['mp3_file']), []).append(index)
+
+    results: List[Tuple[str, Optional[TaggingError]]] = [None] * len(items)
+
+    def tag(indexes: List[int]) -> None:
+        for index in indexes:
+            item = items[index]
+            try:
+                set_id3_tags(**item)
+                results[index] = (item['mp3_file'], None)
+            except TaggingError as e:
+                results[index] = (item['mp3_file'], e)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(groups))) as executor:
+        # list() re-raises unexpected worker errors
+        list(executor.map(tag, groups.values()))
+    return results
+
+
+def load_cover(
+    cover_file: Optional[str] = None,
+    cover_url: Optional[str] = None
+) -> Optional[bytes]:
+    """
+    Read cover art for embedding
+
+    Failures are reported as warnings, tagging continues without a cover.
+
+    Args:
+        cover_file: Path or URL of a custom cover (takes precedence)
+        cover_url: URL to download cover art from (e.g. from the API)
+
+    Returns:
+        Cover image bytes, or None if no cover is available
+    """
+    # Priority: custom file/URL > URL from API
+    if cover_file:
+        # Check if it's a URL
+        if cover_file.startswith(('http://', 'https://')):
+            try:
+                return _download_cover(cover_file)
+            except Exception as e:
+                print(f"Warning: Could not download cover from URL: {e}")
+        # Check if it's a local file
+        elif Path(cover_file).exists():
+            try:
+                with open(cover_file, 'rb') as f:
+                    return f.read()
+            except OSError as e:
+                # Directory, permissions, ...: continue without cover
+                print(f"Warning: Could not read cover: {e}")
+        else:
+            print(f"Warning: Cover file not found: {cover_file}")
+    elif cover_url:
+        # Download cover from API URL
+        try:
+            return _download_cover(cover_url)
+        except Exception as e:
+            # Don't fail if cover download fails, just skip it
+            print(f"Warning: Could not download cover art: {e}")
+    return None
+
+
+def _download_cover(url: str) -> bytes:
+    """Stream a cover image into memory, failing once it exceeds MAX_COVER_SIZE"""
+    with _SESSION.get(url, timeout=30, stream=True) as response:
+        response.raise_for_status()
+        data = bytearray()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            data += chunk
+            if len(data) > MAX_COVER_SIZE:
+                raise ValueError(f"cover exceeds {MAX_COVER_SIZE // (1024 * 1024)} MiB")
+    return bytes(data)
+
+
 def extract_tags_from_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
     """
     Extract tag information from Suno API metadata
@@ -0,0 +1,186 @@
+"""
+Local receiver for sunoapi.org task callbacks
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterable, Optional, Set
+
+# Callback bodies are small JSON documents, refuse anything larger
+MAX_BODY = 1024 * 1024
+
+
+class CallbackServer:
+    """
+    Minimal HTTP server that records sunoapi.org callbacks by task ID
+
+    sunoapi.org POSTs to the client's callback_url when a task changes
+    state. That URL must be publicly reachable and forward to this server
+    (e.g. via ngrok during development).
+
+    Example:
+        with CallbackServer(port=8765) as server:
+            client = SunoClient(api_key, callback_url="https://my-host/callback",
+                                callback_server=server)
+            client.wait_for_completion(task_id)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, path: str = "/callback"):
+        """
+        Initialize callback server
+
+        Args:
+            host: Interface to listen on (loopback by default, the public
+                callback_url is expected to be forwarded by a tunnel or proxy)
+            port: Port to listen on
+            path: URL path that accepts callbacks
+        """
+        self.host = host
+        self.port = port
+        self.path = path
+        # Only callbacks for watched tasks are recorded, so stray or forged
+        # task IDs cannot grow these sets
+        self._watched: Set[str] = set()
+        self._arrived: Set[str] = set()
+        self._cond = threading.Condition()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start serving callbacks in a background thread"""
+        callback_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if self.path.split('?', 1)[0] != callback_server.path:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+
+                header = self.headers.get('Content-Length')
+                if header is None:
+                    self.send_response(411)
+                    self.end_headers()
+                    return
+                try:
+                    length = int(header)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    self.send_response(400)
+                    self.end_headers()
+                    return
+                if length > MAX_BODY:
+                    self.send_response(413)
+                    self.end_headers()
+                    return
+
+                callback_server._handle(self.rfile.read(length))
+                self.send_response(200)
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                # Keep the CLI output clean
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the server"""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "CallbackServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def watch(self, task_ids: Iterable[str]) -> None:
+        """
+        Start recording callbacks for tasks
+
+        Callbacks that arrive between waits are kept until the next wait.
+
+        Args:
+            task_ids: Task IDs to record callbacks for
+        """
+        with self._cond:
+            self._watched.update(task_ids)
+
+    def forget(self, task_ids: Iterable[str]) -> None:
+        """
+        Stop recording callbacks for tasks and drop any unconsumed ones
+
+        Args:
+            task_ids: Task IDs that are no longer waited on
+        """
+        task_ids = set(task_ids)
+        with self._cond:
+            self._watched -= task_ids
+            self._arrived -= task_ids
+
+    def wait(self, task_id: str, timeout: float) -> bool:
+        """
+        Block until a callback for task_id arrives or timeout expires
+
+        Args:
+            task_id: Task ID to wait for
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if a callback arrived, False on timeout
+        """
+        return self.wait_any((task_id,), timeout)
+
+    def wait_any(self, task_ids: Iterable[str], timeout: float) -> bool:
+        """
+        Block until a callback for any of task_ids arrives or timeout expires
+
+        The task IDs are watched from now on, see watch().
+
+        Args:
+            task_ids: Task IDs to wait for
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if a callback arrived, False on timeout
+        """
+        task_ids = set(task_ids)
+        with self._cond:
+            self._watched |= task_ids
+            received = self._cond.wait_for(lambda: self._arrived & task_ids, timeout)
+            # Tasks report several stages (text, first, complete), re-arm for the next one
+            self._arrived -= task_ids
+        return bool(received)
+
+    def _handle(self, body: bytes) -> None:
+        """Signal the waiter of the task referenced in a callback body"""
+        try:
+            payload = json.loads(body or b'{}')
+        except ValueError:
+            return
+
+        task_id = _find_task_id(payload)
+        if not task_id:
+            return
+        with self._cond:
+            if task_id in self._watched:
+                self._arrived.add(task_id)
+                self._cond.notify_all()
+
+
+def _find_task_id(payload: Any) -> Optional[str]:
+    """Extract the task ID from a callback payload (flat or nested under 'data')"""
+    if not isinstance(payload, dict):
+        return None
+    task_id = payload.get('taskId') or payload.get('task_id')
+    if task_id:
+        return task_id
+    return _find_task_id(payload.get('data'))